@@ -14,20 +14,61 @@ the Free Software Foundation, either version 3 of the License, or
 (at your option) any later version.
 """
 
+import re
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import serial
 import threading
 import time
-import statistics
 import csv
+import shutil
+import tempfile
+import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from datetime import datetime, timedelta
-from collections import deque
 from fc2231_calibration_manager import FC2231CalibrationManager
 
+PLOT_POINTS = 500  # Samples kept on the live plot
+INITIAL_TIME_SPAN = 30  # Seconds shown before the time axis first grows
+
+# Data line: reading,voltage,V,temp,force_N,N,force_g,g,timestamp
+# Groups are reading, voltage and temperature; command responses
+# ("FC2231,...") and partial lines don't match
+LINE_RE = re.compile(rb'^(\d+),(-?\d+(?:\.\d+)?),V,([^,]*),[^,]*,N,[^,]*,g,\d+')
+
+# GUI refresh cadences, independent of the serial sample rate
+DISPLAY_INTERVAL_MS = 50    # Reading labels and drift status
+PLOT_INTERVAL_MS = 250      # Live plot
+STATS_INTERVAL_MS = 1000    # Min/max/average labels
+
+# Serial read timeout; bounds how long stop_reading waits for the reader thread
+READ_TIMEOUT = 0.1
+
+def decimate_minmax(t, y, bins):
+    """Reduce a trace to a min and a max point per bin (one bin per pixel
+    column), keeping its visual envelope; short traces pass through"""
+    k = len(y) // bins
+    if k < 2:
+        return t, y
+    # Whole bins only, ending at the newest sample
+    n = bins * k
+    y = y[-n:].reshape(bins, k)
+    t_bins = t[-n::k]
+    return np.repeat(t_bins, 2), np.column_stack((y.min(axis=1), y.max(axis=1))).ravel()
+
+def drain_lines(ser, buf):
+    """Yield every complete line waiting on the serial port, blocking up to
+    the port timeout for the first byte"""
+    buf += ser.read(ser.in_waiting or 1)
+    end = buf.rfind(b'\n')
+    if end >= 0:
+        # One slice and split per wake; the partial tail stays in buf
+        lines = buf[:end].split(b'\n')
+        del buf[:end + 1]
+        yield from lines
+
 class FC2231KawaiiGUI:
     def __init__(self, root):
         self.root = root
@@ -47,11 +88,28 @@ class FC2231KawaiiGUI:
         self.reading_thread = None
         self.is_running = False
         
-        # Data storage
-        self.voltage_data = deque(maxlen=500)  # Store up to 500 points
-        self.force_data = deque(maxlen=500)
-        self.time_data = deque(maxlen=500)
-        self.session_data = []
+        # Data storage: doubled ring buffers, each sample written at i and
+        # i + PLOT_POINTS so the latest samples are always one contiguous slice
+        self.time_buf = np.zeros(2 * PLOT_POINTS)
+        self.voltage_buf = np.zeros(2 * PLOT_POINTS)
+        self.force_buf = np.zeros(2 * PLOT_POINTS)
+        self.plot_head = 0
+        self.plot_count = 0
+        # Set by the reader thread when new samples land; cleared by the
+        # plot and statistics timers so idle ticks do nothing
+        self.plot_dirty = False
+        self.stats_dirty = False
+        
+        # Session rows are streamed to a spool file rather than kept in memory;
+        # export copies them in behind a fresh metadata header
+        self.session_file = tempfile.TemporaryFile('w+', buffering=1 << 16, encoding='utf-8', newline='')
+        self.session_writer = csv.writer(self.session_file)
+        self.session_count = 0
+        self.session_lock = threading.Lock()
+        
+        # Extremes of everything plotted so far; axis limits only ever grow
+        self.plot_v_min = self.plot_f_min = float('inf')
+        self.plot_v_max = self.plot_f_max = float('-inf')
         
         # Current readings
         self.current_voltage = tk.StringVar(value="0.000 V")
@@ -66,6 +124,14 @@ class FC2231KawaiiGUI:
         self.reading_count = 0
         self.last_raw_voltage = 0.0
         
+        # Latest (voltage, force_n, force_g) from the reader thread, picked up
+        # by the display timer
+        self.latest_reading = None
+        self.shown_reading = None
+        
+        # Last text/options pushed to each Tk variable or widget
+        self._last = {}
+        
         # Calibration state
         self.calibrating = False
         self.calibration_readings = []
@@ -73,10 +139,16 @@ class FC2231KawaiiGUI:
         # Drift monitoring
         self.baseline_force = None
         self.max_drift = 0.0
-        self.drift_readings = []
+        self.current_drift = None
         
         self.setup_gui()
         self.show_calibration_status()
+        
+        # Periodic GUI refreshes replace per-sample callbacks from the reader thread
+        self.root.after(DISPLAY_INTERVAL_MS, self.update_display)
+        self.root.after(PLOT_INTERVAL_MS, self.refresh_plot)
+        self.root.after(STATS_INTERVAL_MS, self.update_statistics)
+        
         self.show_about_dialog()
         
     def setup_gui(self):
@@ -142,9 +214,9 @@ class FC2231KawaiiGUI:
         drift_frame.pack(pady=10, padx=10, fill='x')
         
         self.drift_status = tk.StringVar(value="No baseline set")
-        drift_label = tk.Label(drift_frame, textvariable=self.drift_status,
+        self.drift_label = tk.Label(drift_frame, textvariable=self.drift_status,
                               font=('Arial', 10), bg='#ecf0f1', fg='#7f8c8d')
-        drift_label.pack(anchor='w')
+        self.drift_label.pack(anchor='w')
         
         # Control buttons frame
         control_frame = tk.LabelFrame(left_panel, text="🎮 Controls", 
@@ -263,8 +335,23 @@ class FC2231KawaiiGUI:
         self.ax2.grid(True, alpha=0.3)
         self.ax2.set_facecolor('#f8f9fa')
         
+        # Start from limits that already cover the sensor's range, so the
+        # axes (and the cached background) rarely need rebuilding
+        max_force = self.calibration_data.get("max_force_newtons", 100.0)
+        self.ax1.set_xlim(0, INITIAL_TIME_SPAN)
+        self.ax2.set_xlim(0, INITIAL_TIME_SPAN)
+        self.ax1.set_ylim(0, 5)  # Arduino analog input range
+        self.ax2.set_ylim(-0.1 * max_force, 1.1 * max_force)
+        
+        # Live traces are animated: left out of full redraws and blitted on
+        # top of a cached background instead
+        self.voltage_line, = self.ax1.plot([], [], 'b-', linewidth=1.5, alpha=0.6, animated=True)
+        self.force_line, = self.ax2.plot([], [], 'r-', linewidth=3, alpha=0.8, animated=True)
+        self.plot_background = None
+        
         # Embed plot in tkinter
         self.canvas = FigureCanvasTkAgg(self.fig, master=graph_frame)
+        self.canvas.mpl_connect('draw_event', self.on_plot_draw)
         self.canvas.draw()
         self.canvas.get_tk_widget().pack(expand=True, fill='both')
         
@@ -296,7 +383,7 @@ class FC2231KawaiiGUI:
     def start_reading(self):
         """Start reading from Arduino"""
         try:
-            self.serial_connection = serial.Serial(self.port, self.baudrate, timeout=1)
+            self.serial_connection = serial.Serial(self.port, self.baudrate, timeout=READ_TIMEOUT)
             time.sleep(2)  # Wait for Arduino to initialize
             
             self.is_running = True
@@ -316,6 +403,11 @@ class FC2231KawaiiGUI:
     def stop_reading(self):
         """Stop reading from Arduino"""
         self.is_running = False
+        # The reader wakes within READ_TIMEOUT; let it finish before the
+        # port goes away underneath it
+        if self.reading_thread:
+            self.reading_thread.join(timeout=1)
+            self.reading_thread = None
         if self.serial_connection:
             self.serial_connection.close()
             self.serial_connection = None
@@ -328,122 +420,207 @@ class FC2231KawaiiGUI:
     def read_serial_data(self):
         """Read data from Arduino in background thread"""
         start_time = time.time()
+        last_time = 0.0
+        rx = bytearray()
+        # Session timestamps: the date/time prefix only changes once a second
+        stamp_second = None
+        stamp_prefix = ''
         
         while self.is_running and self.serial_connection:
             try:
-                line = self.serial_connection.readline()
-                if line:
-                    decoded = line.decode('utf-8', errors='ignore').strip()
-                    
-                    # Skip Arduino command responses
-                    if decoded.startswith("FC2231,") or not ',' in decoded:
-                        continue
+                # Only the voltage is used; the Arduino's own force values
+                # are replaced by our calibration
+                voltages = []
+                for line in drain_lines(self.serial_connection, rx):
+                    m = LINE_RE.match(line)
+                    if m:
+                        voltages.append(float(m[2]))
+                if not voltages:
+                    continue
+                
+                # Convert the whole batch at once; its samples are spread
+                # evenly over the time since the previous batch
+                now = time.time()
+                n = len(voltages)
+                voltage_arr = np.array(voltages)
+                force_arr = self.cal_manager.voltage_to_force_array(voltage_arr, self.calibration_data)
+                grams_arr = self.cal_manager.force_to_grams_array(force_arr)
+                current_time = now - start_time
+                time_arr = np.linspace(last_time, current_time, n + 1)[1:]
+                last_time = current_time
+                
+                voltage = voltages[-1]
+                force_newtons = float(force_arr[-1])
+                force_grams = float(grams_arr[-1])
+                self.last_raw_voltage = voltage
+                
+                # Store for drift monitoring
+                self.last_force_n = force_newtons
+                
+                # Update drift monitoring
+                self.update_drift_monitoring(force_arr)
+                
+                # Store data for plotting (only the newest PLOT_POINTS matter)
+                keep = min(n, PLOT_POINTS)
+                idx = (self.plot_head + np.arange(n - keep, n)) % PLOT_POINTS
+                for buf, values in ((self.time_buf, time_arr), (self.voltage_buf, voltage_arr),
+                                    (self.force_buf, force_arr)):
+                    buf[idx] = buf[idx + PLOT_POINTS] = values[n - keep:]
+                self.plot_head = (self.plot_head + n) % PLOT_POINTS
+                self.plot_count = min(self.plot_count + n, PLOT_POINTS)
+                self.plot_v_min = min(self.plot_v_min, voltage_arr.min())
+                self.plot_v_max = max(self.plot_v_max, voltage_arr.max())
+                self.plot_f_min = min(self.plot_f_min, force_arr.min())
+                self.plot_f_max = max(self.plot_f_max, force_arr.max())
+                self.plot_dirty = self.stats_dirty = True
+                
+                # Handle calibration
+                if self.calibrating:
+                    self.calibration_readings.extend(voltages[:20 - len(self.calibration_readings)])
+                    count = len(self.calibration_readings)
+                    self.root.after(0, self.update_calibration_progress, count)
                     
-                    # Parse data line: reading,voltage,V,temp,force_N,N,force_g,g,timestamp
-                    parts = decoded.split(',')
-                    if len(parts) >= 9:
+                    if count >= 20:
+                        self.calibrating = False
+                        # Calculate new calibration
                         try:
-                            voltage = float(parts[1])
-                            self.last_raw_voltage = voltage
-                            
-                            # Apply our calibration
-                            force_newtons = self.cal_manager.voltage_to_force(voltage, self.calibration_data)
-                            force_grams = self.cal_manager.force_to_grams(force_newtons)
-                            
-                            # Store for drift monitoring
-                            self.last_force_n = force_newtons
+                            new_calibration = self.cal_manager.perform_voltage_tare(self.calibration_readings)
                             
-                            # Update drift monitoring
-                            self.update_drift_monitoring(force_newtons)
-                            
-                            # Store data for plotting
-                            current_time = time.time() - start_time
-                            self.voltage_data.append(voltage)
-                            self.force_data.append(force_newtons)
-                            self.time_data.append(current_time)
-                            
-                            # Handle calibration
-                            if self.calibrating:
-                                self.calibration_readings.append(voltage)
-                                self.root.after(0, lambda: self.update_calibration_progress(len(self.calibration_readings)))
-                                
-                                if len(self.calibration_readings) >= 20:
-                                    # Calculate new calibration
-                                    try:
-                                        new_calibration = self.cal_manager.perform_voltage_tare(self.calibration_readings)
-                                        
-                                        # Save calibration
-                                        if self.cal_manager.save_calibration(new_calibration):
-                                            self.calibration_data = new_calibration
-                                            self.root.after(0, self.finish_calibration)
-                                        else:
-                                            self.root.after(0, lambda: self.calibration_error("Failed to save calibration"))
-                                    except Exception as e:
-                                        self.root.after(0, lambda: self.calibration_error(str(e)))
-                            
-                            # Update GUI
-                            self.root.after(0, lambda: self.update_display(voltage, force_newtons, force_grams))
-                            
-                            # Store session data
-                            self.session_data.append({
-                                'timestamp': datetime.now(),
-                                'voltage': voltage,
-                                'force_n': force_newtons,
-                                'force_g': force_grams
-                            })
-                            
-                        except (ValueError, IndexError):
-                            pass
+                            # Save calibration
+                            if self.cal_manager.save_calibration(new_calibration):
+                                self.calibration_data = new_calibration
+                                self.root.after(0, self.finish_calibration)
+                            else:
+                                self.root.after(0, self.calibration_error, "Failed to save calibration")
+                        except Exception as e:
+                            self.root.after(0, self.calibration_error, str(e))
+                
+                # Hand the newest reading to the display timer
+                self.reading_count += n
+                self.latest_reading = (voltage, force_newtons, force_grams)
+                
+                # Store session data
+                with self.session_lock:
+                    writerow = self.session_writer.writerow
+                    for t, v, f, g in zip((time_arr + start_time).tolist(), voltages,
+                                          force_arr.tolist(), grams_arr.tolist()):
+                        second = int(t)
+                        if second != stamp_second:
+                            stamp_second = second
+                            stamp_prefix = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second))
+                        writerow([
+                            f"{stamp_prefix}.{int((t - second) * 1000):03d}",
+                            f"{v:.4f}",
+                            f"{f:.3f}",
+                            f"{g:.1f}"
+                        ])
+                    self.session_count += n
                             
             except Exception as e:
                 if self.is_running:  # Only show error if we're supposed to be running
                     print(f"Serial read error: {e}")
                 break
     
-    def update_display(self, voltage, force_n, force_g):
-        """Update GUI display with new readings"""
-        self.current_voltage.set(f"{voltage:.3f} V")
-        self.current_force_n.set(f"{force_n:.2f} N")
-        self.current_force_g.set(f"{force_g:.1f} g")
-        
-        self.reading_count += 1
-        
-        # Update statistics
-        if len(self.force_data) > 0:
-            forces = list(self.force_data)
-            non_zero_forces = [f for f in forces if abs(f) > 0.01]  # >0.01N threshold
+    def update_display(self):
+        """Show the latest reading, if a new one arrived since the last tick"""
+        reading = self.latest_reading
+        if reading is not self.shown_reading:
+            self.shown_reading = reading
+            voltage, force_n, force_g = reading
+            self._set(self.current_voltage, f"{voltage:.3f} V")
+            self._set(self.current_force_n, f"{force_n:.2f} N")
+            self._set(self.current_force_g, f"{force_g:.1f} g")
+            self.show_drift_status()
+        
+        self.root.after(DISPLAY_INTERVAL_MS, self.update_display)
+    
+    def update_statistics(self):
+        """Refresh the min/max/average labels from the plotted window"""
+        if self.stats_dirty:
+            self.stats_dirty = False
+            forces = self.plot_window()[2]
+            non_zero_forces = forces[np.abs(forces) > 0.01]  # >0.01N threshold
             
-            if non_zero_forces:
-                self.min_force.set(f"{min(non_zero_forces):.2f} N")
-                self.max_force.set(f"{max(non_zero_forces):.2f} N")
-                self.avg_force.set(f"{statistics.mean(non_zero_forces):.2f} N")
+            if non_zero_forces.size:
+                self._set(self.min_force, f"{non_zero_forces.min():.2f} N")
+                self._set(self.max_force, f"{non_zero_forces.max():.2f} N")
+                self._set(self.avg_force, f"{non_zero_forces.mean():.2f} N")
         
-        # Update plot every 10 readings
-        if self.reading_count % 10 == 0:
+        self.root.after(STATS_INTERVAL_MS, self.update_statistics)
+    
+    def _set(self, var, value):
+        """Set a Tk variable only when its text actually changes"""
+        key = str(var)
+        if self._last.get(key) != value:
+            self._last[key] = value
+            var.set(value)
+    
+    def _config(self, widget, **options):
+        """Configure a widget only when its options actually change"""
+        key = str(widget)
+        if self._last.get(key) != options:
+            self._last[key] = options
+            widget.config(**options)
+    
+    def refresh_plot(self):
+        """Periodic plot refresh, skipped when no samples arrived"""
+        if self.plot_dirty:
+            self.plot_dirty = False
             self.update_plot()
+        self.root.after(PLOT_INTERVAL_MS, self.refresh_plot)
     
     def update_plot(self):
         """Update the real-time plot"""
-        if len(self.time_data) > 0:
-            # Clear and plot voltage
-            self.ax1.clear()
-            self.ax1.plot(self.time_data, self.voltage_data, 'b-', linewidth=1.5, alpha=0.6)
-            self.ax1.set_title('⚡ Voltage vs Time', fontsize=10, color='#2c3e50')
-            self.ax1.set_ylabel('Voltage (V)', color='#8e44ad', fontsize=9)
-            self.ax1.grid(True, alpha=0.3)
-            self.ax1.set_facecolor('#f8f9fa')
-            
-            # Clear and plot force - MAIN FOCUS
-            self.ax2.clear()
-            self.ax2.plot(self.time_data, self.force_data, 'r-', linewidth=3, alpha=0.8)
-            self.ax2.set_title('💪 FORCE MONITOR - Real-time Force vs Time', fontsize=14, color='#2c3e50', weight='bold')
-            self.ax2.set_xlabel('Time (seconds)', fontsize=11)
-            self.ax2.set_ylabel('Force (N)', color='#e67e22', fontsize=12, weight='bold')
-            self.ax2.grid(True, alpha=0.3)
-            self.ax2.set_facecolor('#f8f9fa')
+        if self.plot_count > 0:
+            times, voltages, forces = self.plot_window()
+            # Never hand Agg more than two points per pixel column
+            bins = max(int(self.ax2.bbox.width), 1)
+            self.voltage_line.set_data(*decimate_minmax(times, voltages, bins))
+            self.force_line.set_data(*decimate_minmax(times, forces, bins))
             
-            # Refresh canvas
-            self.canvas.draw()
+            if self.expand_plot_limits(times[0], times[-1]) or self.plot_background is None:
+                # Axes changed: full redraw, which re-captures the background
+                self.canvas.draw()
+            else:
+                # Only the traces changed: repaint them over the cached axes
+                self.canvas.restore_region(self.plot_background)
+                self.blit_plot_lines()
+    
+    def plot_window(self):
+        """Return (time, voltage, force) views of the plotted samples, oldest first"""
+        end = self.plot_head + PLOT_POINTS
+        start = end - self.plot_count
+        return self.time_buf[start:end], self.voltage_buf[start:end], self.force_buf[start:end]
+    
+    def expand_plot_limits(self, t_first, t_last):
+        """Grow the axes (with 50% headroom) once the data leaves them;
+        returns True if any limit changed"""
+        changed = False
+        if t_last > self.ax2.get_xlim()[1]:
+            xlim = (t_first, t_last + 0.5 * max(t_last - t_first, 1.0))
+            self.ax1.set_xlim(xlim)
+            self.ax2.set_xlim(xlim)
+            changed = True
+        for ax, lo, hi in ((self.ax1, self.plot_v_min, self.plot_v_max),
+                           (self.ax2, self.plot_f_min, self.plot_f_max)):
+            ymin, ymax = ax.get_ylim()
+            if lo < ymin or hi > ymax:
+                margin = 0.25 * max(hi - lo, 0.01)
+                ax.set_ylim(min(lo - margin, ymin), max(hi + margin, ymax))
+                changed = True
+        return changed
+    
+    def on_plot_draw(self, event):
+        """Re-capture the static background after every full redraw
+        (including resizes) and put the traces back on top"""
+        self.plot_background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self.blit_plot_lines()
+    
+    def blit_plot_lines(self):
+        """Draw just the live traces and push them to the screen"""
+        self.ax1.draw_artist(self.voltage_line)
+        self.ax2.draw_artist(self.force_line)
+        self.canvas.blit(self.fig.bbox)
     
     def quick_tare(self):
         """Quick tare using current reading"""
@@ -471,31 +648,28 @@ class FC2231KawaiiGUI:
         if hasattr(self, 'last_force_n') and self.last_force_n is not None:
             self.baseline_force = self.last_force_n
             self.max_drift = 0.0
-            self.drift_readings = []
-            self.drift_status.set(f"Baseline: {self.baseline_force:.3f}N | Max drift: 0.000N")
+            self.current_drift = None
+            self._set(self.drift_status, f"Baseline: {self.baseline_force:.3f}N | Max drift: 0.000N")
             messagebox.showinfo("Drift Baseline Set", 
                               f"📊 Baseline force: {self.baseline_force:.3f}N\n"
                               f"Now unclamp the sensor to monitor drift!")
         else:
             messagebox.showwarning("No Data", "No force reading available!")
     
-    def update_drift_monitoring(self, current_force):
-        """Update drift monitoring with current force reading"""
+    def update_drift_monitoring(self, forces):
+        """Update drift monitoring with a batch of force readings (reader thread)"""
         if self.baseline_force is not None:
-            drift = abs(current_force - self.baseline_force)
-            self.drift_readings.append(drift)
-            
-            # Keep only last 100 readings for average
-            if len(self.drift_readings) > 100:
-                self.drift_readings = self.drift_readings[-100:]
+            drifts = np.abs(forces - self.baseline_force)
             
             # Update max drift
-            if drift > self.max_drift:
-                self.max_drift = drift
-            
-            # Calculate average drift
-            avg_drift = sum(self.drift_readings) / len(self.drift_readings)
+            self.max_drift = max(self.max_drift, float(drifts.max()))
             
+            self.current_drift = float(drifts[-1])
+    
+    def show_drift_status(self):
+        """Show the latest drift figures (GUI thread)"""
+        drift = self.current_drift
+        if self.baseline_force is not None and drift is not None:
             # Update display with color coding
             if self.max_drift < 0.1:  # Less than 0.1N drift
                 color = '#27ae60'  # Green
@@ -507,13 +681,11 @@ class FC2231KawaiiGUI:
                 color = '#e74c3c'  # Red
                 status = "🔴 HIGH DRIFT"
             
-            self.drift_status.set(f"{status} | Baseline: {self.baseline_force:.3f}N | "
-                                f"Current drift: {drift:.3f}N | Max: {self.max_drift:.3f}N")
+            self._set(self.drift_status, f"{status} | Baseline: {self.baseline_force:.3f}N | "
+                                         f"Current drift: {drift:.3f}N | Max: {self.max_drift:.3f}N")
             
             # Change color of drift label
-            for widget in self.drift_status.master.winfo_children():
-                if isinstance(widget, tk.Label):
-                    widget.config(fg=color)
+            self._config(self.drift_label, fg=color)
     
     def start_calibration(self):
         """Start 20-point calibration"""
@@ -540,7 +712,8 @@ class FC2231KawaiiGUI:
         """Complete the calibration process"""
         self.calibrating = False
         new_tare = self.calibration_data["tare_voltage"]
-        stability = statistics.stdev(self.calibration_readings)
+        # Sample standard deviation, already computed by perform_voltage_tare
+        stability = self.calibration_data["calibration_stability"]
         
         self.status_label.config(text="🌸 Status: Calibration Complete!", fg='#27ae60')
         self.calibrate_button.config(state='normal')
@@ -564,7 +737,7 @@ class FC2231KawaiiGUI:
     
     def export_data(self):
         """Export session data to CSV"""
-        if not self.session_data:
+        if not self.session_count:
             messagebox.showwarning("No Data", "No data to export!")
             return
         
@@ -600,19 +773,19 @@ class FC2231KawaiiGUI:
                     # Data header
                     writer.writerow(['Timestamp', 'Voltage (V)', 'Force (N)', 'Force (g)'])
                     
-                    # Data rows
-                    for data_point in self.session_data:
-                        writer.writerow([
-                            data_point['timestamp'].strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
-                            f"{data_point['voltage']:.4f}",
-                            f"{data_point['force_n']:.3f}",
-                            f"{data_point['force_g']:.1f}"
-                        ])
+                    # Data rows, copied from the spool file; the reader
+                    # thread waits on the lock for the duration of the copy
+                    with self.session_lock:
+                        self.session_file.flush()
+                        self.session_file.seek(0)
+                        shutil.copyfileobj(self.session_file, csvfile)
+                        self.session_file.seek(0, 2)
+                        records = self.session_count
                 
                 messagebox.showinfo("Export Complete", 
                                   f"🎌 Data exported successfully! 🎌\n\n" +
                                   f"File: {filename}\n" +
-                                  f"Records: {len(self.session_data)}")
+                                  f"Records: {records}")
                 
             except Exception as e:
                 messagebox.showerror("Export Error", f"Failed to export data:\n{e}")
@@ -652,6 +825,7 @@ def main():
     def on_closing():
         if app.is_running:
             app.stop_reading()
+        app.session_file.close()
         root.destroy()
     
     root.protocol("WM_DELETE_WINDOW", on_closing)
@@ -3,37 +3,56 @@
 Simple Arduino Connection Test
 """
 
+import re
 import serial
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-def test_arduino_connection():
-    ports_to_try = ['COM5', 'COM4', 'COM3', 'COM6']
-    
-    for port in ports_to_try:
+PORTS_TO_TRY = ['COM5', 'COM4', 'COM3', 'COM6']
+
+# What the FC2231 sketch sends: "FC2231,..." status lines, or data lines of
+# reading,voltage,V,temperature,force,N,grams,g,millis
+EXPECTED_RE = re.compile(rb'^(?:FC2231,|\d+,-?\d+(?:\.\d+)?,V,)')
+
+def probe_port(port):
+    """Open a port and wait for a line from the FC2231 sketch. Returns the
+    still-open port and that line, or None (with the port closed)"""
+    ser = serial.Serial(port, 9600, timeout=2)
+    try:
+        # Wait for Arduino to initialize
+        time.sleep(3)
+        for _ in range(3):
+            line = ser.readline()
+            if EXPECTED_RE.match(line):
+                return ser, line.decode('utf-8', errors='ignore').strip()
+    except BaseException:
+        ser.close()
+        raise
+    ser.close()
+    return None
+
+def _close_probe(future):
+    """Close the port of a probe that found the Arduino after another did"""
+    if not future.cancelled() and future.exception() is None and future.result():
+        future.result()[0].close()
+
+def find_arduino_port(ports_to_try=PORTS_TO_TRY):
+    """Probe all candidate ports at once; the first one that talks wins.
+    Returns (port, open serial connection), or None"""
+    ex = ThreadPoolExecutor(max_workers=len(ports_to_try))
+    futures = {ex.submit(probe_port, port): port for port in ports_to_try}
+    print(f"🔍 Probing {', '.join(ports_to_try)}...")
+    found = None
+    for future in as_completed(futures):
+        port = futures[future]
         try:
-            print(f"🔍 Trying to connect to {port}...")
-            with serial.Serial(port, 9600, timeout=2) as ser:
-                print(f"✅ Connected to {port}!")
-                
-                # Wait for Arduino to initialize
-                time.sleep(3)
-                
-                # Try to read some data
-                print("📡 Listening for data...")
-                for i in range(10):
-                    try:
-                        line = ser.readline()
-                        if line:
-                            decoded = line.decode('utf-8', errors='ignore').strip()
-                            print(f"📨 Received: {decoded}")
-                        else:
-                            print(f"⏳ Waiting... ({i+1}/10)")
-                        time.sleep(1)
-                    except Exception as e:
-                        print(f"⚠️  Read error: {e}")
-                
-                return True
-                
+            result = future.result()
+            if result:
+                ser, line = result
+                print(f"✅ Arduino found on {port}: {line}")
+                found = port, ser
+                break
+            print(f"⏳ {port} opened but sent no FC2231 data")
         except serial.SerialException as e:
             print(f"❌ Failed to connect to {port}: {e}")
         except PermissionError as e:
@@ -41,10 +60,41 @@ def test_arduino_connection():
             print("💡 Hint: Close Arduino IDE Serial Monitor if open")
         except Exception as e:
             print(f"⚠️  Unexpected error with {port}: {e}")
-    
-    print("❌ Could not connect to any port")
-    return False
+
+    if found:
+        # Don't wait for the slower probes; close whatever they open
+        for other in futures:
+            if other is not future:
+                other.add_done_callback(_close_probe)
+    ex.shutdown(wait=False, cancel_futures=True)
+    return found
+
+def test_arduino_connection():
+    found = find_arduino_port()
+    if found is None:
+        print("❌ Could not connect to any port")
+        return False
+
+    port, ser = found
+    with ser:
+        print(f"✅ Connected to {port}!")
+
+        # Already initialized and talking, so listen straight away
+        print("📡 Listening for data...")
+        for i in range(10):
+            try:
+                line = ser.readline()
+                if line:
+                    decoded = line.decode('utf-8', errors='ignore').strip()
+                    print(f"📨 Received: {decoded}")
+                else:
+                    print(f"⏳ Waiting... ({i+1}/10)")
+                time.sleep(1)
+            except Exception as e:
+                print(f"⚠️  Read error: {e}")
+
+    return True
 
 if __name__ == "__main__":
     print("🌸 Arduino Connection Test 🌸")
-    test_arduino_connection()
\ No newline at end of file
+    test_arduino_connection()
@@ -4,8 +4,7 @@ Test CSV export functionality without Arduino
 """
 
 import csv
-from datetime import datetime
-from fc2231_terminal import KawaiiFC2231Monitor
+from fc2231_terminal import KawaiiFC2231Monitor, EXPORT_COLUMNS
 
 def test_csv_export():
     """Test CSV export with sample data"""
@@ -14,48 +13,28 @@ def test_csv_export():
     # Create monitor instance
     monitor = KawaiiFC2231Monitor()
     
-    # Add sample data
-    monitor.export_enabled = True
-    
-    # Simulate some readings
-    sample_data = [
-        {
-            'Reading#': 1,
-            'DateTime': datetime.now(),
-            'Time': '10:30:15',
-            'Voltage(V)': 0.498,
-            'Force(N)': 0.000,
-            'Force(g)': 0.0,
-            'Temperature(°C)': 23.5,
-            'Status': 'ZERO'
-        },
-        {
-            'Reading#': 55,
-            'DateTime': datetime.now(),
-            'Time': '10:30:20',
-            'Voltage(V)': 1.245,
-            'Force(N)': 15.678,
-            'Force(g)': 1599.2,
-            'Temperature(°C)': 23.7,
-            'Status': 'MEDIUM'
-        },
-        {
-            'Reading#': 110,
-            'DateTime': datetime.now(),
-            'Time': '10:30:25',
-            'Voltage(V)': 2.890,
-            'Force(N)': 45.123,
-            'Force(g)': 4602.8,
-            'Temperature(°C)': 24.1,
-            'Status': 'STRONG'
-        }
+    # Simulate some readings, as raw lines in the Arduino's format
+    # (reading,voltage,V,temperature,force,N,grams,g,millis)
+    sample_lines = [
+        b"1,0.4980,V,23.5,0.000,N,0.00,g,15000",
+        b"55,1.2450,V,23.7,15.678,N,1599.20,g,20000",
+        b"110,2.8900,V,24.1,45.123,N,4602.80,g,25000",
     ]
     
-    monitor.export_data = sample_data
+    # Test export: record the readings, then read the file back
+    if not monitor.start_export():
+        print("❌ CSV export test failed!")
+        return
+    for line in sample_lines:
+        monitor.process_arduino_data(line)
+    print(f"📊 Sample data records: {monitor.export_count}")
+    monitor.stop_export()
     
-    # Test export
-    print(f"📊 Sample data records: {len(monitor.export_data)}")
-    success = monitor.export_to_csv()
+    with open(monitor.export_filename, newline='', encoding='utf-8') as f:
+        rows = list(csv.reader(f))
+    success = (tuple(rows[0]) == EXPORT_COLUMNS
+               and [row[0] for row in rows[1:]] == ['1', '55', '110']
+               and all(len(row) == len(EXPORT_COLUMNS) for row in rows[1:]))
     
     if success:
         print("✅ CSV export test successful!")
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Test the FC2231 nonlinear response table (lut) calibration path
+"""
+
+import numpy as np
+from fc2231_calibration_manager import FC2231CalibrationManager
+
+# Only converts and validates, so the file is never read or written
+CALIBRATION_FILE = "test_lut_calibration.json"
+
+def make_calibration(cal_manager, lut):
+    """Default calibration with the given response table"""
+    calibration_data = dict(cal_manager.default_calibration)
+    calibration_data["lut"] = lut
+    return calibration_data
+
+def test_lut_conversion():
+    """Scalar and array conversions agree and interpolate the table"""
+    cal_manager = FC2231CalibrationManager(CALIBRATION_FILE)
+
+    # Tared voltage (0.5V at zero load) to Newtons, curving upwards
+    lut = {"v": [0.5, 1.5, 2.5, 4.5], "f": [0.0, 5.0, 20.0, 100.0]}
+    calibration_data = make_calibration(cal_manager, lut)
+    assert cal_manager.validate_calibration(calibration_data)
+
+    # Below, on, between and beyond the table points
+    voltages = [0.0, 0.5, 1.0, 1.5, 2.0, 3.5, 4.5, 5.0]
+    expected = [0.0, 0.0, 2.5, 5.0, 12.5, 60.0, 100.0, 100.0]
+    scalar = [cal_manager.voltage_to_force(v, calibration_data) for v in voltages]
+    array = cal_manager.voltage_to_force_array(voltages, calibration_data)
+    grams = cal_manager.voltage_to_grams_array(voltages, calibration_data)
+    assert np.allclose(scalar, expected), scalar
+    assert np.allclose(array, expected), array
+    assert np.allclose(grams, cal_manager.force_to_grams_array(expected)), grams
+
+    # Dropping the table goes back to the straight line
+    linear = make_calibration(cal_manager, None)
+    assert cal_manager.validate_calibration(linear)
+    assert np.isclose(cal_manager.voltage_to_force(2.5, linear), 50.0)
+
+def test_lut_validation():
+    """Malformed tables are rejected"""
+    cal_manager = FC2231CalibrationManager(CALIBRATION_FILE)
+    bad_tables = {
+        "not a dict": [[0.5, 4.5], [0.0, 100.0]],
+        "missing f": {"v": [0.5, 4.5]},
+        "length mismatch": {"v": [0.5, 2.5, 4.5], "f": [0.0, 100.0]},
+        "single point": {"v": [0.5], "f": [0.0]},
+        "descending": {"v": [4.5, 0.5], "f": [100.0, 0.0]},
+        "repeated voltage": {"v": [0.5, 2.5, 2.5, 4.5], "f": [0.0, 40.0, 60.0, 100.0]},
+        "non-numeric": {"v": [0.5, "4.5"], "f": [0.0, 100.0]},
+        "not finite": {"v": [0.5, 4.5], "f": [0.0, float("nan")]},
+    }
+    for name, lut in bad_tables.items():
+        assert not cal_manager.validate_calibration(make_calibration(cal_manager, lut)), name
+        print(f"✅ Rejected table: {name}")
+
+if __name__ == "__main__":
+    print("🧪 Testing LUT Calibration")
+    test_lut_conversion()
+    print("✅ Scalar and array conversions match the table")
+    test_lut_validation()
+    print("✅ LUT calibration test successful!")
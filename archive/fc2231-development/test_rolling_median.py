@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Test the rolling median used to smooth FC2231 readings
+"""
+
+import random
+import statistics
+from fc2231_terminal import RollingMedian
+
+def check_window(window, values):
+    """Compare RollingMedian with a plain median of the same window"""
+    rolling = RollingMedian(window)
+    for i, value in enumerate(values):
+        rolling.add(value)
+        expected = statistics.median(values[max(0, i + 1 - window):i + 1])
+        assert len(rolling) == min(i + 1, window)
+        assert rolling.median() == expected, (window, i, rolling.median(), expected)
+
+def test_rolling_median():
+    """Windows of 1, odd and even size, on noise, repeats and a steady drift"""
+    print("🧪 Testing Rolling Median")
+
+    rng = random.Random(2231)
+    sequences = {
+        "noise": [rng.uniform(-5.0, 5.0) for _ in range(2000)],
+        "repeats": [float(rng.randint(0, 4)) for _ in range(2000)],
+        "drift": [i * 0.01 for i in range(2000)],
+    }
+    for window in (1, 2, 5, 10):
+        for name, values in sequences.items():
+            check_window(window, values)
+            print(f"✅ Window {window:>2}, {name}")
+
+    print("✅ Rolling median test successful!")
+
+if __name__ == "__main__":
+    test_rolling_median()
@@ -12,6 +12,20 @@ import time
 import queue
 from fc2231_calibration_manager import FC2231CalibrationManager
 
+# Serial read timeout; bounds how long stop_reading waits for the reader thread
+READ_TIMEOUT = 0.1
+
+def drain_lines(ser, buf):
+    """Yield every complete line waiting on the serial port, blocking up to
+    the port timeout for the first byte"""
+    buf += ser.read(ser.in_waiting or 1)
+    end = buf.rfind(b'\n')
+    if end >= 0:
+        # One slice and split per wake; the partial tail stays in buf
+        lines = buf[:end].split(b'\n')
+        del buf[:end + 1]
+        yield from lines
+
 class WorkingFC2231GUI:
     def __init__(self):
         self.root = tk.Tk()
@@ -27,10 +41,11 @@ class WorkingFC2231GUI:
         self.port = 'COM5'
         self.baudrate = 9600
         self.serial_connection = None
+        self.reading_thread = None
         self.is_running = False
         
         # Data queue for thread safety
-        self.data_queue = queue.Queue()
+        self.data_queue = queue.SimpleQueue()
         
         # Calibration
         self.cal_manager = FC2231CalibrationManager()
@@ -140,7 +155,7 @@ class WorkingFC2231GUI:
             self.status_var.set("🔌 Connecting...")
             self.root.update()  # Force GUI update
             
-            self.serial_connection = serial.Serial(self.port, self.baudrate, timeout=1)
+            self.serial_connection = serial.Serial(self.port, self.baudrate, timeout=READ_TIMEOUT)
             print("🔧 Serial connection established, waiting for Arduino...")
             time.sleep(2)  # Wait for Arduino initialization
             
@@ -172,6 +187,12 @@ class WorkingFC2231GUI:
         print("🔧 Stopping reading...")
         self.is_running = False
         
+        # The reader wakes within READ_TIMEOUT; let it finish before the
+        # port goes away underneath it
+        if self.reading_thread:
+            self.reading_thread.join(timeout=1)
+            self.reading_thread = None
+        
         if self.serial_connection:
             try:
                 self.serial_connection.close()
@@ -189,41 +210,38 @@ class WorkingFC2231GUI:
     def read_serial_data(self):
         """Read data from Arduino in background thread"""
         print("🔧 Serial reading thread started")
+        rx = bytearray()
         
         while self.is_running and self.serial_connection:
             try:
-                if self.serial_connection.in_waiting > 0:
-                    line = self.serial_connection.readline()
-                    if line:
-                        decoded = line.decode('utf-8', errors='ignore').strip()
+                # Blocks in the driver until data arrives (or the port timeout),
+                # then takes everything waiting in one read
+                for line in drain_lines(self.serial_connection, rx):
+                    # Skip Arduino command responses
+                    if line.startswith(b"FC2231,") or b',' not in line:
+                        continue
                         
-                        # Skip Arduino command responses
-                        if decoded.startswith("FC2231,") or not ',' in decoded:
-                            continue
+                    # Parse data line: reading,voltage,V,temp,force_N,N,force_g,g,timestamp
+                    parts = line.split(b',')
+                    if len(parts) >= 9:
+                        try:
+                            voltage = float(parts[1])
+                            force_newtons = self.cal_manager.voltage_to_force(voltage, self.calibration_data)
+                            
+                            # Put data in queue for GUI thread
+                            self.data_queue.put({
+                                'voltage': voltage,
+                                'force': force_newtons,
+                                'timestamp': time.time()
+                            })
                             
-                        # Parse data line: reading,voltage,V,temp,force_N,N,force_g,g,timestamp
-                        parts = decoded.split(',')
-                        if len(parts) >= 9:
-                            try:
-                                voltage = float(parts[1])
-                                force_newtons = self.cal_manager.voltage_to_force(voltage, self.calibration_data)
-                                
-                                # Put data in queue for GUI thread
-                                self.data_queue.put({
-                                    'voltage': voltage,
-                                    'force': force_newtons,
-                                    'timestamp': time.time()
-                                })
-                                
-                                # Print every 20th reading
-                                self.reading_count += 1
-                                if self.reading_count % 20 == 0:
-                                    print(f"📊 Reading #{self.reading_count}: {voltage:.3f}V → {force_newtons:.3f}N")
-                                
-                            except (ValueError, IndexError) as e:
-                                print(f"⚠️ Parse error: {e}")
-                                
-                time.sleep(0.05)  # Small delay
+                            # Print every 20th reading
+                            self.reading_count += 1
+                            if self.reading_count % 20 == 0:
+                                print(f"📊 Reading #{self.reading_count}: {voltage:.3f}V → {force_newtons:.3f}N")
+                            
+                        except (ValueError, IndexError) as e:
+                            print(f"⚠️ Parse error: {e}")
                 
             except Exception as e:
                 if self.is_running:
@@ -239,9 +257,17 @@ class WorkingFC2231GUI:
     def update_gui(self):
         """Update GUI with new data from queue"""
         try:
-            # Process all available data
-            while not self.data_queue.empty():
-                data = self.data_queue.get_nowait()
+            # Drain everything queued since the last tick
+            data = None
+            get = self.data_queue.get_nowait
+            try:
+                while True:
+                    data = get()
+            except queue.Empty:
+                pass
+            
+            # Only the newest reading is shown
+            if data is not None:
                 self.current_voltage = data['voltage']
                 self.current_force = data['force']
                 
@@ -250,8 +276,6 @@ class WorkingFC2231GUI:
                 self.force_var.set(f"{self.current_force:.3f} N")
                 self.count_var.set(f"Readings: {self.reading_count}")
                 
-        except queue.Empty:
-            pass
         except Exception as e:
             print(f"⚠️ GUI update error: {e}")
             
@@ -1,10 +1,37 @@
+import sys
+import os
+import re
 import serial
 import time
+import csv
 from datetime import datetime
 
 PORT = 'COM4'
 BAUDRATE = 9600
+LINE_RE = re.compile(rb'^(\d+),(-?\d+(?:\.\d+)?),lbs,(-?\d+(?:\.\d+)?)')
 TARE_POINT_GRAMS = -15901.7  # From previous tare
+LB_TO_G = 453.592
+NEG_TARE_G = -TARE_POINT_GRAMS
+
+def tune_latency_timer(port):
+    """Drop a Linux USB-serial adapter's latency timer from 16 ms to 1 ms"""
+    path = f'/sys/bus/usb-serial/devices/{os.path.basename(port)}/latency_timer'
+    try:
+        with open(path, 'w') as f:
+            f.write('1')
+    except OSError:
+        pass  # Not Linux, not a USB-serial adapter, or no permission
+
+def drain_lines(ser, buf):
+    """Yield every complete line waiting on the serial port, blocking up to
+    the port timeout for the first byte"""
+    buf += ser.read(ser.in_waiting or 1)
+    end = buf.rfind(b'\n')
+    if end >= 0:
+        # One slice and split per wake; the partial tail stays in buf
+        lines = buf[:end].split(b'\n')
+        del buf[:end + 1]
+        yield from lines
 
 def monitor_drift():
     print("=== OpenScale Drift Monitor ===")
@@ -13,63 +40,69 @@ def monitor_drift():
     print("Press Ctrl+C to stop and show graph")
     print("-" * 50)
     
-    timestamps = []
-    weights = []
-    temperatures = []
-    raw_readings = []
+    # Rows go straight to disk through a 1 MB buffer; only the first and
+    # last (time, weight, temperature, raw reading) are kept for the analysis
+    first = last = None
+    n = 0
+    csv_file = None
+    
+    # Console output is flushed once per batch of lines, not on every print
+    sys.stdout.reconfigure(line_buffering=False)
     
     try:
-        with serial.Serial(PORT, BAUDRATE, timeout=2) as ser:
+        os.makedirs('openscale-project', exist_ok=True)
+        csv_file = open('openscale-project/drift_data.csv', 'w', buffering=1 << 20, newline='')
+        writer = csv.writer(csv_file)
+        writer.writerow(["Time(s)", "Weight(g)", "Temperature(C)", "RawReading(g)"])
+        
+        with serial.Serial(PORT, BAUDRATE, timeout=0.05) as ser:
+            tune_latency_timer(PORT)
             # Skip initial messages
             time.sleep(2)
             for _ in range(5):
                 ser.readline()
             
+            rx = bytearray()
             start_time = time.time()
             
             while True:
-                line = ser.readline()
-                if line:
-                    decoded = line.decode('utf-8', errors='ignore').strip()
-                    if ',' in decoded and decoded.split(',')[0].isdigit():
-                        parts = decoded.split(',')
-                        if len(parts) >= 4:
-                            current_time = time.time() - start_time
-                            raw_lbs = float(parts[1])
-                            temp = float(parts[3])
-                            
-                            # Convert to grams and subtract tare point
-                            raw_grams = raw_lbs * 453.592
-                            weight_grams = raw_grams - TARE_POINT_GRAMS
-                            
-                            # Store data
-                            timestamps.append(current_time)
-                            weights.append(weight_grams)
-                            temperatures.append(temp)
-                            raw_readings.append(raw_grams)
-                            
-                            print(f"Time: {current_time:6.1f}s | Weight: {weight_grams:7.1f}g | "
-                                  f"Temp: {temp:6.2f}°C | Raw: {raw_grams:8.1f}g")
-                
-                time.sleep(0.5)  # Read every 500ms
+                for line in drain_lines(ser, rx):
+                    m = LINE_RE.match(line)
+                    if m:
+                        current_time = time.time() - start_time
+                        raw_lbs = float(m[2])
+                        temp = float(m[3])
+                        
+                        # Convert to grams and subtract tare point
+                        raw_grams = raw_lbs * LB_TO_G
+                        weight_grams = raw_grams + NEG_TARE_G
+                        
+                        # Store data
+                        last = (current_time, weight_grams, temp, raw_grams)
+                        if first is None:
+                            first = last
+                        n += 1
+                        writer.writerow((f"{current_time:.1f}", f"{weight_grams:.1f}",
+                                         f"{temp:.2f}", f"{raw_grams:.1f}"))
+                        
+                        print(f"Time: {current_time:6.1f}s | Weight: {weight_grams:7.1f}g | "
+                              f"Temp: {temp:6.2f}°C | Raw: {raw_grams:8.1f}g")
+                sys.stdout.flush()
                 
     except KeyboardInterrupt:
-        print(f"\n📊 Analysis of {len(weights)} readings over {timestamps[-1]:.1f} seconds:")
+        duration = last[0] if n else 0.0
+        print(f"\n📊 Analysis of {n} readings over {duration:.1f} seconds:")
         
-        if len(weights) > 2:
+        if n > 2:
             # Calculate drift rates
-            weight_start = weights[0]
-            weight_end = weights[-1]
-            weight_drift = weight_end - weight_start
-            weight_drift_rate = weight_drift / timestamps[-1]  # g/s
-            
-            temp_start = temperatures[0]
-            temp_end = temperatures[-1]
-            temp_drift = temp_end - temp_start
+            weight_drift = last[1] - first[1]
+            temp_drift = last[2] - first[2]
+            raw_drift = last[3] - first[3]
+            weight_drift_rate = weight_drift / duration  # g/s
             
             print(f"Weight drift: {weight_drift:+.1f}g total ({weight_drift_rate:+.2f}g/s)")
             print(f"Temperature drift: {temp_drift:+.3f}°C")
-            print(f"Raw reading drift: {raw_readings[-1] - raw_readings[0]:+.1f}g")
+            print(f"Raw reading drift: {raw_drift:+.1f}g")
             
             # Analyze the cause
             print(f"\n🔍 Drift Analysis:")
@@ -88,17 +121,16 @@ def monitor_drift():
                     print("   - Temperature compensation")
             else:
                 print("✅ Drift is within acceptable range")
-            
-            # Save data to file
-            with open('openscale-project/drift_data.csv', 'w') as f:
-                f.write("Time(s),Weight(g),Temperature(C),RawReading(g)\n")
-                for i in range(len(timestamps)):
-                    f.write(f"{timestamps[i]:.1f},{weights[i]:.1f},{temperatures[i]:.2f},{raw_readings[i]:.1f}\n")
-            
+        
+        if csv_file is not None:
+            csv_file.flush()
             print(f"💾 Data saved to drift_data.csv")
         
     except Exception as e:
         print(f"❌ Error: {e}")
+    finally:
+        if csv_file is not None:
+            csv_file.close()
 
 if __name__ == "__main__":
     monitor_drift()
@@ -25,12 +25,116 @@ import serial
 import threading
 import time
 import statistics
+import array
 import csv
-from datetime import datetime, timedelta
-from collections import deque
+import io
+import re
+import numpy as np
+from datetime import datetime
 from calibration_manager import CalibrationManager
 
+CALIBRATION_SAMPLES = 20
+LB_TO_G = 453.592
+CALIB_STATUS = [f"🌸 Status: Calibrating... ({i}/{CALIBRATION_SAMPLES})"
+                for i in range(CALIBRATION_SAMPLES + 1)]
+
+# Status colours and (text, colour) pairs shared by every status change
+COLOR_OK = '#27ae60'
+COLOR_ERROR = '#e74c3c'
+COLOR_BUSY = '#f39c12'
+COLOR_TARE = '#9b59b6'
+COLOR_POSITIVE = '#e67e22'
+COLOR_NEGATIVE = '#3498db'
+STATUS_CONNECTED = ("🟢 Status: Connected & Reading", COLOR_OK)
+STATUS_DISCONNECTED = ("🔴 Status: Disconnected", COLOR_ERROR)
+STATUS_QUICK_TARE = ("🎯 Status: Quick Tare Applied", COLOR_TARE)
+STATUS_CALIBRATED = ("🌸 Status: Calibration Complete!", COLOR_OK)
+STATUS_CALIBRATION_FAILED = ("❌ Status: Calibration Failed", COLOR_ERROR)
+
+_ABOUT_TEXT = """🌸 Force Monitor v2.0 🌸
+Kawaii Precision Weight Measurement
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+👨‍🔬 Author:
+Johnny Hamnesjö Olausson
+
+📧 Email:
+johnny.hamnesjo@chalmers.se
+
+🏛️ Institution:
+Chalmers University of Technology
+Department of Industrial and Materials Science
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+📄 License:
+GNU General Public License v3.0
+
+This program is free software: you can redistribute it 
+and/or modify it under the terms of the GNU General 
+Public License as published by the Free Software 
+Foundation.
+
+This program is distributed in the hope that it will be 
+useful, but WITHOUT ANY WARRANTY.
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+🌸 Designed with kawaii simplicity and precision 🌸"""
+
+LINE_RE = re.compile(rb'^(\d+),(-?\d+(?:\.\d+)?),lbs,(-?\d+(?:\.\d+)?)')
+
+def drain_lines(ser, buf):
+    """Yield every complete line waiting on the serial port, blocking up to
+    the port timeout for the first byte"""
+    buf += ser.read(ser.in_waiting or 1)
+    end = buf.rfind(b'\n')
+    if end >= 0:
+        # One slice and split per wake; the partial tail stays in buf
+        lines = buf[:end].split(b'\n')
+        del buf[:end + 1]
+        yield from lines
+
+def median_of_window(window):
+    """Median of the smoothing window; a fixed 6-comparison network once it
+    holds five readings"""
+    if len(window) < 5:
+        return statistics.median(window)
+    a, b, c, d, e = window
+    if a > b:
+        a, b = b, a
+    if c > d:
+        c, d = d, c
+    if a > c:  # a is then the smallest of a..d and can't be the median
+        a, c = c, a
+        b, d = d, b
+    if b > e:
+        b, e = e, b
+    if b < c:
+        return e if e < c else c
+    return b if b < d else d
+
 class EnhancedForceMonitorGUI:
+    # Fixed attribute set: the serial thread's per-sample lookups become slot
+    # reads instead of __dict__ probes
+    __slots__ = (
+        'root', 'port', 'baudrate', 'cal_manager', 'calibration_data', '_coeffs',
+        'serial_connection', 'reading_thread', 'is_running',
+        'current_weight', 'session_weights', 'session_count',
+        'readings_buffer', '_win_i', '_win_filled',
+        'session_start_time', '_session_t0', 'reading_count', 'last_raw_reading',
+        '_pending', '_pending_lock', '_last',
+        'min_weight', 'max_weight', 'weight_sum', 'nonzero_count',
+        'calibrating', 'calibration_readings', '_cal_idx',
+        # Widgets and Tk variables
+        'status_label', 'cal_status_var', 'cal_status_label',
+        'weight_var', 'weight_label', 'zero_indicator', 'weight_indicator',
+        'temp_var', 'count_var', 'time_var', 'min_var', 'max_var', 'avg_var',
+        'start_button', 'stop_button', 'calibrate_button', 'tare_button',
+        'reset_button', 'export_button', 'about_button',
+    )
+    
     def __init__(self, root):
         self.root = root
         self.root.title("🌸 Force Monitor v2.0 - Kawaii Edition 🌸")
@@ -44,6 +148,7 @@ class EnhancedForceMonitorGUI:
         # Load calibration from persistent storage
         self.cal_manager = CalibrationManager()
         self.calibration_data = self.cal_manager.load_calibration()
+        self._update_coefficients()
         
         self.serial_connection = None
         self.reading_thread = None
@@ -51,20 +156,35 @@ class EnhancedForceMonitorGUI:
         
         # Data tracking
         self.current_weight = 0.0
-        self.session_weights = []
-        self.readings_buffer = deque(maxlen=10)  # For smoothing
+        # float32 keeps far more than the 0.1 g shown and halves the memory
+        # each reduction walks; grows by doubling
+        self.session_weights = np.empty(1 << 16, dtype=np.float32)
+        self.session_count = 0
+        self.readings_buffer = [0.0] * 5  # Smoothing ring, oldest slot overwritten
+        self._win_i = 0
+        self._win_filled = 0
         self.session_start_time = datetime.now()
+        self._session_t0 = time.monotonic()
         self.reading_count = 0
         self.last_raw_reading = 0.0
         
+        # Latest reading waiting for the GUI; the lock also guards session data
+        self._pending = None
+        self._pending_lock = threading.Lock()
+        
+        # Last text/options pushed to each widget, to skip no-op Tk updates
+        self._last = {}
+        
         # Statistics
         self.min_weight = float('inf')
         self.max_weight = float('-inf')
         self.weight_sum = 0.0
+        self.nonzero_count = 0
         
         # Calibration state
         self.calibrating = False
-        self.calibration_readings = []
+        self.calibration_readings = array.array('d', [0.0] * CALIBRATION_SAMPLES)
+        self._cal_idx = 0
         
         self.setup_gui()
         self.show_calibration_status()
@@ -87,9 +207,9 @@ class EnhancedForceMonitorGUI:
         status_frame = tk.Frame(self.root, bg='#f8f5f0')
         status_frame.pack(pady=5)
         
-        self.status_label = tk.Label(status_frame, text="🔴 Status: Disconnected", 
+        self.status_label = tk.Label(status_frame, text=STATUS_DISCONNECTED[0], 
                                    font=('Arial', 12), 
-                                   bg='#f8f5f0', fg='#e74c3c')
+                                   bg='#f8f5f0', fg=STATUS_DISCONNECTED[1])
         self.status_label.pack()
         
         # Main display frame with subtle border
@@ -267,7 +387,15 @@ class EnhancedForceMonitorGUI:
         # Auto-start after a short delay
         self.root.after(1500, self.start_reading)
         self.root.after(1000, self.update_session_time)
+        self.root.after(40, self._drain_pending)
         
+    def _update_coefficients(self):
+        """Fold lbs-to-grams, tare and scale factor into one multiply-add"""
+        tare_offset = self.calibration_data.get("tare_offset", 0.0)
+        scale_factor = self.calibration_data.get("scale_factor", 1.0) or 1.0
+        # One tuple, so the serial thread never sees a half-updated pair
+        self._coeffs = (LB_TO_G / scale_factor, -tare_offset / scale_factor)
+    
     def show_calibration_status(self):
         """Display current calibration status"""
         status = self.cal_manager.get_calibration_status(self.calibration_data)
@@ -281,24 +409,29 @@ class EnhancedForceMonitorGUI:
                 self.serial_connection.close()
                 time.sleep(0.5)
                 
-            self.serial_connection = serial.Serial(self.port, self.baudrate, timeout=1)
+            self.serial_connection = serial.Serial(self.port, self.baudrate, timeout=0.05)
+            # A deep driver buffer rides out GUI stalls without dropping lines
+            # (only the Windows backend lets us size it)
+            if hasattr(self.serial_connection, 'set_buffer_size'):
+                self.serial_connection.set_buffer_size(rx_size=1 << 16)
             self.is_running = True
             self.reading_thread = threading.Thread(target=self.read_serial_data, daemon=True)
             self.reading_thread.start()
             
             # Reset session start time
             self.session_start_time = datetime.now()
+            self._session_t0 = time.monotonic()
             
             # Update UI with kawaii status
-            self.status_label.config(text="🟢 Status: Connected & Reading", fg='#27ae60')
+            self._show_status(STATUS_CONNECTED)
             self.start_button.config(state='disabled')
             self.stop_button.config(state='normal')
             
         except serial.SerialException as e:
-            self.status_label.config(text=f"❌ Status: Serial Error - {str(e)}", fg='#e74c3c')
+            self.status_label.config(text=f"❌ Status: Serial Error - {str(e)}", fg=COLOR_ERROR)
             messagebox.showerror("Connection Error", f"Failed to connect to {self.port}")
         except Exception as e:
-            self.status_label.config(text=f"❌ Status: Error - {str(e)}", fg='#e74c3c')
+            self.status_label.config(text=f"❌ Status: Error - {str(e)}", fg=COLOR_ERROR)
     
     def stop_reading(self):
         self.is_running = False
@@ -306,7 +439,7 @@ class EnhancedForceMonitorGUI:
             self.serial_connection.close()
         
         # Update UI with kawaii status
-        self.status_label.config(text="🔴 Status: Disconnected", fg='#e74c3c')
+        self._show_status(STATUS_DISCONNECTED)
         self.start_button.config(state='normal')
         self.stop_button.config(state='disabled')
     
@@ -322,9 +455,10 @@ class EnhancedForceMonitorGUI:
                                    "This will take 20 readings to establish a new zero point.\n\n" +
                                    "Continue with calibration?")
         if result:
+            self.calibration_readings = array.array('d', [0.0] * CALIBRATION_SAMPLES)
+            self._cal_idx = 0
             self.calibrating = True
-            self.calibration_readings = []
-            self.status_label.config(text="🌸 Status: Calibrating... (0/20)", fg='#f39c12')
+            self.status_label.config(text=CALIB_STATUS[0], fg=COLOR_BUSY)
             self.calibrate_button.config(state='disabled')
     
     def quick_tare(self):
@@ -337,12 +471,13 @@ class EnhancedForceMonitorGUI:
             # Save calibration
             if self.cal_manager.save_calibration(new_calibration):
                 self.calibration_data = new_calibration
+                self._update_coefficients()
                 self.show_calibration_status()
-                self.status_label.config(text="🎯 Status: Quick Tare Applied", fg='#9b59b6')
+                self._show_status(STATUS_QUICK_TARE)
                 messagebox.showinfo("Tare Complete", 
                                   f"🎌 New tare offset: {self.last_raw_reading:.2f}g\n💾 Calibration saved!")
                 # Reset back to connected after 2 seconds
-                self.root.after(2000, lambda: self.status_label.config(text="🟢 Status: Connected & Reading", fg='#27ae60'))
+                self.root.after(2000, self._restore_connected_status)
             else:
                 messagebox.showerror("Save Error", "Failed to save calibration!")
         else:
@@ -353,59 +488,30 @@ class EnhancedForceMonitorGUI:
         result = messagebox.askyesno("Reset Statistics", 
                                    "🔄 Reset all session statistics?")
         if result:
-            self.session_weights = []
-            self.min_weight = float('inf')
-            self.max_weight = float('-inf')
-            self.weight_sum = 0.0
-            self.reading_count = 0
+            with self._pending_lock:
+                self.session_count = 0
+                self.min_weight = float('inf')
+                self.max_weight = float('-inf')
+                self.weight_sum = 0.0
+                self.nonzero_count = 0
+                self.reading_count = 0
             self.session_start_time = datetime.now()
+            self._session_t0 = time.monotonic()
             
             # Update display
-            self.min_var.set("--")
-            self.max_var.set("--")
-            self.avg_var.set("--")
-            self.count_var.set("0")
-            self.time_var.set("00:00")
+            self._set(self.min_var, "--")
+            self._set(self.max_var, "--")
+            self._set(self.avg_var, "--")
+            self._set(self.count_var, "0")
+            self._set(self.time_var, "00:00")
     
     def show_about_dialog(self):
         """Show about dialog with author information"""
-        about_text = """🌸 Force Monitor v2.0 🌸
-Kawaii Precision Weight Measurement
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-👨‍🔬 Author:
-Johnny Hamnesjö Olausson
-
-📧 Email:
-johnny.hamnesjo@chalmers.se
-
-🏛️ Institution:
-Chalmers University of Technology
-Department of Industrial and Materials Science
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-📄 License:
-GNU General Public License v3.0
-
-This program is free software: you can redistribute it 
-and/or modify it under the terms of the GNU General 
-Public License as published by the Free Software 
-Foundation.
-
-This program is distributed in the hope that it will be 
-useful, but WITHOUT ANY WARRANTY.
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-🌸 Designed with kawaii simplicity and precision 🌸"""
-        
-        messagebox.showinfo("About", about_text)
+        messagebox.showinfo("About", _ABOUT_TEXT)
     
     def export_data(self):
         """Export session data to CSV"""
-        if not self.session_weights:
+        if not self.session_count:
             messagebox.showwarning("No Data", "No data to export!")
             return
             
@@ -418,40 +524,52 @@ useful, but WITHOUT ANY WARRANTY.
         
         if filename:
             try:
-                with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                    writer = csv.writer(csvfile)
-                    
-                    # Write header with kawaii styling
-                    writer.writerow(['🌸 Force Monitor Session Export 🌸', datetime.now().strftime('%Y-%m-%d %H:%M:%S')])
-                    writer.writerow([])
-                    writer.writerow(['👨‍🔬 Author:', 'Johnny Hamnesjö Olausson'])
-                    writer.writerow(['📧 Email:', 'johnny.hamnesjo@chalmers.se'])
-                    writer.writerow(['🏛️ Institution:', 'Chalmers University of Technology'])
-                    writer.writerow(['📚 Department:', 'Department of Industrial and Materials Science'])
-                    writer.writerow([])
-                    writer.writerow(['⚖️ Tare Offset (g)', f'{self.calibration_data.get("tare_offset", 0.0):.4f}'])
-                    writer.writerow(['📏 Scale Factor', f'{self.calibration_data.get("scale_factor", 1.0):.4f}'])
-                    cal_date = self.calibration_data.get("calibration_date", "Never")
-                    writer.writerow(['📅 Calibration Date', cal_date])
-                    writer.writerow(['🔢 Total Readings', len(self.session_weights)])
-                    writer.writerow(['⏱️ Session Duration', self.time_var.get()])
-                    writer.writerow([])  # Empty row
-                    
-                    # Write statistics with emojis
-                    writer.writerow(['📊 Statistics'])
-                    if self.session_weights:
-                        writer.writerow(['📉 Minimum (g)', f'{min(self.session_weights):.2f}'])
-                        writer.writerow(['📈 Maximum (g)', f'{max(self.session_weights):.2f}'])
-                        writer.writerow(['📊 Average (g)', f'{statistics.mean(self.session_weights):.2f}'])
-                        writer.writerow(['📏 Std Deviation (g)', f'{statistics.stdev(self.session_weights) if len(self.session_weights) > 1 else 0:.2f}'])
-                    writer.writerow([])  # Empty row
-                    
-                    # Write data points
-                    writer.writerow(['📋 Reading #', 'Weight (g)', 'Timestamp'])
-                    for i, weight in enumerate(self.session_weights):
-                        timestamp = (self.session_start_time + 
-                                   timedelta(seconds=i*0.5)).strftime('%H:%M:%S')
-                        writer.writerow([i+1, f'{weight:.2f}', timestamp])
+                # Build the whole file in memory and write it in one call
+                out = io.StringIO()
+                writer = csv.writer(out)
+                
+                # Write header with kawaii styling
+                writer.writerow(['🌸 Force Monitor Session Export 🌸', datetime.now().strftime('%Y-%m-%d %H:%M:%S')])
+                writer.writerow([])
+                writer.writerow(['👨‍🔬 Author:', 'Johnny Hamnesjö Olausson'])
+                writer.writerow(['📧 Email:', 'johnny.hamnesjo@chalmers.se'])
+                writer.writerow(['🏛️ Institution:', 'Chalmers University of Technology'])
+                writer.writerow(['📚 Department:', 'Department of Industrial and Materials Science'])
+                writer.writerow([])
+                writer.writerow(['⚖️ Tare Offset (g)', f'{self.calibration_data.get("tare_offset", 0.0):.4f}'])
+                writer.writerow(['📏 Scale Factor', f'{self.calibration_data.get("scale_factor", 1.0):.4f}'])
+                cal_date = self.calibration_data.get("calibration_date", "Never")
+                writer.writerow(['📅 Calibration Date', cal_date])
+                with self._pending_lock:
+                    weights = self.session_weights[:self.session_count].copy()
+                writer.writerow(['🔢 Total Readings', weights.size])
+                writer.writerow(['⏱️ Session Duration', self.time_var.get()])
+                writer.writerow([])  # Empty row
+                
+                # Write statistics with emojis
+                writer.writerow(['📊 Statistics'])
+                writer.writerow(['📉 Minimum (g)', f'{weights.min():.2f}'])
+                writer.writerow(['📈 Maximum (g)', f'{weights.max():.2f}'])
+                # Mean and deviation accumulate in float64 over the float32 data
+                writer.writerow(['📊 Average (g)', f'{weights.mean(dtype=np.float64):.2f}'])
+                writer.writerow(['📏 Std Deviation (g)', f'{weights.std(ddof=1, dtype=np.float64) if weights.size > 1 else 0:.2f}'])
+                writer.writerow([])  # Empty row
+                
+                # Write data points
+                writer.writerow(['📋 Reading #', 'Weight (g)', 'Timestamp'])
+                # Readings are logged 0.5 s apart; build all HH:MM:SS stamps at once
+                stamps = (np.datetime64(self.session_start_time, 'ms') +
+                          np.arange(weights.size) * np.timedelta64(500, 'ms'))
+                secs = (stamps - stamps.astype('datetime64[D]')).astype('timedelta64[s]').astype(np.int64)
+                timestamps = np.char.add(np.char.mod('%02d:', secs // 3600),
+                                         np.char.add(np.char.mod('%02d:', secs // 60 % 60),
+                                                     np.char.mod('%02d', secs % 60))).tolist()
+                writer.writerows(zip(range(1, weights.size + 1),
+                                     np.char.mod('%.2f', weights).tolist(),
+                                     timestamps))
+                
+                with open(filename, 'wb') as csvfile:
+                    csvfile.write(out.getvalue().encode('utf-8'))
                 
                 messagebox.showinfo("Export Complete", 
                                   f"🌸 Data exported successfully! 🌸\n\n{filename}")
@@ -461,72 +579,87 @@ useful, but WITHOUT ANY WARRANTY.
                                    f"Failed to export data:\n{str(e)}")
     
     def read_serial_data(self):
-        # Skip initial messages
-        time.sleep(1)
-        for _ in range(10):
-            if self.serial_connection:
-                self.serial_connection.readline()
+        # Drop whatever queued up before Start, then the first (possibly cut)
+        # line; startup banner lines never match LINE_RE, so they need no skipping
+        rx = bytearray()
+        try:
+            self.serial_connection.reset_input_buffer()
+            while self.is_running and b'\n' not in rx:
+                rx += self.serial_connection.read(self.serial_connection.in_waiting or 1)
+            del rx[:rx.find(b'\n') + 1]
+        except Exception as e:
+            print(f"Error reading serial data: {e}")
+            return
         
         while self.is_running and self.serial_connection:
             try:
-                line = self.serial_connection.readline()
-                if line:
-                    decoded = line.decode('utf-8', errors='ignore').strip()
-                    if ',' in decoded and 'lbs' in decoded:
-                        parts = decoded.split(',')
-                        if len(parts) >= 4 and parts[2] == 'lbs':
-                            raw_lbs = float(parts[1])
-                            temp = float(parts[3])
-                            
-                            # Convert to grams
-                            raw_grams = raw_lbs * 453.592
-                            self.last_raw_reading = raw_grams
-                            
-                            # Apply calibration (tare and scale factor)
-                            weight_grams = self.cal_manager.apply_calibration(raw_grams, self.calibration_data)
-                            
-                            # Handle calibration with kawaii styling
-                            if self.calibrating:
-                                self.calibration_readings.append(raw_grams)
-                                self.root.after(0, lambda: self.status_label.config(
-                                    text=f"🌸 Status: Calibrating... ({len(self.calibration_readings)}/20)", 
-                                    fg='#f39c12'))
-                                
-                                if len(self.calibration_readings) >= 20:
-                                    # Calculate new tare offset using calibration manager
-                                    try:
-                                        new_calibration = self.cal_manager.perform_tare_calibration(self.calibration_readings)
-                                        
-                                        # Save calibration
-                                        if self.cal_manager.save_calibration(new_calibration):
-                                            self.calibration_data = new_calibration
-                                            self.root.after(0, self.finish_calibration)
-                                        else:
-                                            self.root.after(0, lambda: self.calibration_error("Failed to save calibration"))
-                                    except Exception as e:
-                                        self.root.after(0, lambda: self.calibration_error(str(e)))
-                            
-                            # Add to rolling buffer for smoothing
-                            self.readings_buffer.append(weight_grams)
-                            if len(self.readings_buffer) >= 3:
-                                smoothed_weight = statistics.median(self.readings_buffer)
-                            else:
-                                smoothed_weight = weight_grams
-                            
-                            # Update GUI in main thread
-                            self.root.after(0, self.update_display, smoothed_weight, temp)
+                for line in drain_lines(self.serial_connection, rx):
+                    m = LINE_RE.match(line)
+                    if m:
+                        raw_lbs = float(m[2])
+                        temp = float(m[3])
+                        
+                        # Convert to grams
+                        raw_grams = raw_lbs * LB_TO_G
+                        self.last_raw_reading = raw_grams
+                        
+                        # Apply calibration (tare and scale factor)
+                        gain, offset = self._coeffs
+                        weight_grams = raw_lbs * gain + offset
+                        
+                        # Handle calibration with kawaii styling
+                        if self.calibrating and self._cal_idx < CALIBRATION_SAMPLES:
+                            self.calibration_readings[self._cal_idx] = raw_grams
+                            self._cal_idx += 1
+                            self.root.after(0, self._show_calibration_progress, self._cal_idx)
                             
+                            if self._cal_idx >= CALIBRATION_SAMPLES:
+                                # Calculate new tare offset using calibration manager
+                                try:
+                                    new_calibration = self.cal_manager.perform_tare_calibration(self.calibration_readings)
+                                    
+                                    # Save calibration
+                                    if self.cal_manager.save_calibration(new_calibration):
+                                        self.calibration_data = new_calibration
+                                        self._update_coefficients()
+                                        self.root.after(0, self.finish_calibration)
+                                    else:
+                                        self.root.after(0, self.calibration_error, "Failed to save calibration")
+                                except Exception as e:
+                                    self.root.after(0, self.calibration_error, str(e))
+                        
+                        # Add to rolling buffer for smoothing
+                        window = self.readings_buffer
+                        window[self._win_i] = weight_grams
+                        self._win_i = (self._win_i + 1) % 5
+                        if self._win_filled < 5:
+                            self._win_filled += 1
+                        if self._win_filled == 5:
+                            smoothed_weight = median_of_window(window)
+                        elif self._win_filled >= 3:
+                            smoothed_weight = median_of_window(window[:self._win_filled])
+                        else:
+                            smoothed_weight = weight_grams
+                        
+                        # Record now; the GUI picks it up on its next refresh
+                        self._record_reading(smoothed_weight, temp)
+                        
             except Exception as e:
                 print(f"Error reading serial data: {e}")
                 break
     
+    def _show_calibration_progress(self, count):
+        """Show how many calibration readings have been taken"""
+        self.status_label.config(text=CALIB_STATUS[count], fg=COLOR_BUSY)
+    
     def finish_calibration(self):
         """Complete the calibration process"""
         self.calibrating = False
         new_offset = self.calibration_data["tare_offset"]
-        stability = statistics.stdev(self.calibration_readings)
+        readings = np.frombuffer(self.calibration_readings, dtype=np.float64)[:self._cal_idx]
+        stability = float(readings.std(ddof=1))
         
-        self.status_label.config(text="🌸 Status: Calibration Complete!", fg='#27ae60')
+        self._show_status(STATUS_CALIBRATED)
         self.calibrate_button.config(state='normal')
         self.show_calibration_status()
         
@@ -536,78 +669,122 @@ useful, but WITHOUT ANY WARRANTY.
                           f"Standard deviation: {stability:.2f}g\n" +
                           f"💾 Calibration saved to file!")
         # Reset back to connected after 3 seconds
-        self.root.after(3000, lambda: self.status_label.config(text="🟢 Status: Connected & Reading", fg='#27ae60'))
+        self.root.after(3000, self._restore_connected_status)
     
     def calibration_error(self, error_msg):
         """Handle calibration errors"""
         self.calibrating = False
-        self.status_label.config(text="❌ Status: Calibration Failed", fg='#e74c3c')
+        self._show_status(STATUS_CALIBRATION_FAILED)
         self.calibrate_button.config(state='normal')
         messagebox.showerror("Calibration Error", f"Calibration failed:\n{error_msg}")
-        self.root.after(2000, lambda: self.status_label.config(text="🟢 Status: Connected & Reading", fg='#27ae60'))
+        self.root.after(2000, self._restore_connected_status)
+    
+    def _show_status(self, status):
+        """Show one of the STATUS_* (text, colour) pairs"""
+        text, color = status
+        self.status_label.config(text=text, fg=color)
+    
+    def _restore_connected_status(self):
+        """Reset the status label back to connected"""
+        self._show_status(STATUS_CONNECTED)
+    
+    def _record_reading(self, weight, temperature):
+        """Fold a smoothed reading into the session (serial thread) and leave
+        it for the next GUI refresh"""
+        display_weight = 0.0 if abs(weight) < 5 else weight  # Within 5g, show as zero
+        with self._pending_lock:
+            # Add to session data (only if not calibrating)
+            if not self.calibrating:
+                if self.session_count == len(self.session_weights):
+                    self.session_weights = np.resize(self.session_weights, 2 * len(self.session_weights))
+                self.session_weights[self.session_count] = display_weight
+                self.session_count += 1
+                self.current_weight = display_weight
+                self.reading_count += 1
+                
+                # Update statistics (zero readings are left out)
+                if abs(display_weight) > 5:
+                    self.nonzero_count += 1
+                    self.weight_sum += display_weight
+                    if display_weight < self.min_weight:
+                        self.min_weight = display_weight
+                    if display_weight > self.max_weight:
+                        self.max_weight = display_weight
+            
+            self._pending = (weight, temperature)
+    
+    def _drain_pending(self):
+        """Show the latest reading; runs every 40 ms so the GUI redraws at
+        most 25 times a second however fast readings arrive"""
+        with self._pending_lock:
+            pending = self._pending
+            self._pending = None
+        if pending:
+            self.update_display(*pending)
+            # One layout/redraw pass for all the widgets touched this frame
+            self.root.update_idletasks()
+        self.root.after(40, self._drain_pending)
+    
+    def _set(self, var, value):
+        """Set a Tk variable only when its text actually changes"""
+        key = str(var)
+        if self._last.get(key) != value:
+            self._last[key] = value
+            var.set(value)
+    
+    def _config(self, widget, **options):
+        """Configure a widget only when its options actually change"""
+        key = str(widget)
+        if self._last.get(key) != options:
+            self._last[key] = options
+            widget.config(**options)
     
     def update_display(self, weight, temperature):
         # Update current weight display with Japanese-style indicators
         if abs(weight) < 5:  # Within 5g, show as zero
-            self.weight_var.set("0.0")
-            self.weight_label.config(fg='#27ae60')  # Green for zero
-            self.zero_indicator.config(text="🟢")  # Green circle
-            self.weight_indicator.config(text="⚪")  # White circle
-            display_weight = 0.0
+            self._set(self.weight_var, "0.0")
+            self._config(self.weight_label, fg=COLOR_OK)  # Green for zero
+            self._config(self.zero_indicator, text="🟢")  # Green circle
+            self._config(self.weight_indicator, text="⚪")  # White circle
         else:
-            self.weight_var.set(f"{weight:.1f}")
+            self._set(self.weight_var, f"{weight:.1f}")
             if weight > 0:
-                self.weight_label.config(fg='#e67e22')  # Orange for positive
-                self.weight_indicator.config(text="🟠")  # Orange circle
+                self._config(self.weight_label, fg=COLOR_POSITIVE)  # Orange for positive
+                self._config(self.weight_indicator, text="🟠")  # Orange circle
             else:
-                self.weight_label.config(fg='#3498db')  # Blue for negative
-                self.weight_indicator.config(text="🔵")  # Blue circle
-            self.zero_indicator.config(text="⚪")  # White circle
-            display_weight = weight
+                self._config(self.weight_label, fg=COLOR_NEGATIVE)  # Blue for negative
+                self._config(self.weight_indicator, text="🔵")  # Blue circle
+            self._config(self.zero_indicator, text="⚪")  # White circle
         
-        # Add to session data (only if not calibrating)
         if not self.calibrating:
-            self.session_weights.append(display_weight)
-            self.current_weight = display_weight
-            
-            # Update statistics
-            if display_weight != 0:  # Don't include zero readings in min/max
-                if display_weight < self.min_weight:
-                    self.min_weight = display_weight
-                if display_weight > self.max_weight:
-                    self.max_weight = display_weight
-            
             # Update statistics display
-            if self.session_weights:
-                non_zero_weights = [w for w in self.session_weights if abs(w) > 5]
-                if non_zero_weights:
-                    self.min_var.set(f"{min(non_zero_weights):.1f}g")
-                    self.max_var.set(f"{max(non_zero_weights):.1f}g")
-                    self.avg_var.set(f"{statistics.mean(non_zero_weights):.1f}g")
+            if self.session_count:
+                if self.nonzero_count:
+                    self._set(self.min_var, f"{self.min_weight:.1f}g")
+                    self._set(self.max_var, f"{self.max_weight:.1f}g")
+                    self._set(self.avg_var, f"{self.weight_sum / self.nonzero_count:.1f}g")
                 else:
-                    self.min_var.set("0.0g")
-                    self.max_var.set("0.0g")
-                    self.avg_var.set("0.0g")
+                    self._set(self.min_var, "0.0g")
+                    self._set(self.max_var, "0.0g")
+                    self._set(self.avg_var, "0.0g")
+            
+            # Update reading count
+            self._set(self.count_var, str(self.reading_count))
         
         # Update temperature
-        self.temp_var.set(f"{temperature:.1f}")
-        
-        # Update reading count
-        if not self.calibrating:
-            self.reading_count += 1
-            self.count_var.set(str(self.reading_count))
+        self._set(self.temp_var, f"{temperature:.1f}")
     
     def update_session_time(self):
-        """Update the session time display"""
-        if hasattr(self, 'session_start_time'):
-            elapsed = datetime.now() - self.session_start_time
-            hours, remainder = divmod(elapsed.seconds, 3600)
+        """Update the session time display (frozen while stopped)"""
+        if self.is_running:
+            elapsed = int(time.monotonic() - self._session_t0)
+            hours, remainder = divmod(elapsed, 3600)
             minutes, seconds = divmod(remainder, 60)
             if hours > 0:
                 time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
             else:
                 time_str = f"{minutes:02d}:{seconds:02d}"
-            self.time_var.set(time_str)
+            self._set(self.time_var, time_str)
         
         # Schedule next update
         self.root.after(1000, self.update_session_time)
@@ -1,16 +1,45 @@
+import math
+import os
+import re
 import serial
 import time
-import statistics
 
 PORT = 'COM4'
 BAUDRATE = 9600
+LINE_RE = re.compile(rb'^(\d+),(-?\d+(?:\.\d+)?),lbs,(-?\d+(?:\.\d+)?)')
+LB_TO_G = 453.592
+
+# Display rows indexed by "is zero"; both take (reading#, raw, tared, grams, temp)
+ROW_FORMATS = ("%7s | %8.2f | %9.2f | %7.1fg | %7s",
+               "%7s | %8.2f | %9.2f | %.0s    ZERO | %7s")
+
+def tune_latency_timer(port):
+    """Drop a Linux USB-serial adapter's latency timer from 16 ms to 1 ms"""
+    path = f'/sys/bus/usb-serial/devices/{os.path.basename(port)}/latency_timer'
+    try:
+        with open(path, 'w') as f:
+            f.write('1')
+    except OSError:
+        pass  # Not Linux, not a USB-serial adapter, or no permission
+
+def drain_lines(ser, buf):
+    """Yield every complete line waiting on the serial port, blocking up to
+    the port timeout for the first byte"""
+    buf += ser.read(ser.in_waiting or 1)
+    end = buf.rfind(b'\n')
+    if end >= 0:
+        # One slice and split per wake; the partial tail stays in buf
+        lines = buf[:end].split(b'\n')
+        del buf[:end + 1]
+        yield from lines
 
 def proper_tare_and_read():
     print("=== Proper OpenScale Tare & Read ===")
     print("Now that we understand the raw format, let's do this right!")
     
     try:
-        with serial.Serial(PORT, BAUDRATE, timeout=2) as ser:
+        with serial.Serial(PORT, BAUDRATE, timeout=0.05) as ser:
+            tune_latency_timer(PORT)
             # Skip startup messages
             print("Connecting and skipping startup messages...")
             time.sleep(3)
@@ -23,34 +52,44 @@ def proper_tare_and_read():
             input("Press Enter when ready to tare...")
             
             print("Taking 20 readings for tare...")
-            tare_readings = []
+            # Running mean and variance (Welford); stops early once excellent
+            n = 0
+            tare_offset = 0.0
+            m2 = 0.0
+            tare_stability = 0.0
             
-            for i in range(20):
-                line = ser.readline()
-                if line:
-                    decoded = line.decode('utf-8', errors='ignore').strip()
-                    if ',' in decoded and 'lbs' in decoded:
-                        parts = decoded.split(',')
-                        if len(parts) >= 3 and parts[2] == 'lbs':
-                            try:
-                                weight_lbs = float(parts[1])
-                                tare_readings.append(weight_lbs)
-                                if i % 5 == 0:
-                                    print(f"  Tare reading {i+1}/20: {weight_lbs} lbs")
-                            except ValueError:
-                                pass
-                time.sleep(0.2)
+            rx = bytearray()
+            lines_seen = 0
+            done = False
+            deadline = time.time() + 10
+            while not done and time.time() < deadline:
+                for line in drain_lines(ser, rx):
+                    i = lines_seen
+                    lines_seen += 1
+                    m = LINE_RE.match(line)
+                    if m:
+                        weight_lbs = float(m[2])
+                        n += 1
+                        delta = weight_lbs - tare_offset
+                        tare_offset += delta / n
+                        m2 += delta * (weight_lbs - tare_offset)
+                        if n > 1:
+                            tare_stability = math.sqrt(m2 / (n - 1))
+                        if i % 5 == 0:
+                            print(f"  Tare reading {i+1}/20: {weight_lbs} lbs")
+                    done = lines_seen >= 20 or (n >= 5 and tare_stability < 0.01)
+                    if done:
+                        break
             
-            if not tare_readings:
+            if not n:
                 print("❌ No valid tare readings obtained")
                 return
             
-            tare_offset = statistics.mean(tare_readings)
-            tare_stability = statistics.stdev(tare_readings)
+            tare_offset_g = tare_offset * LB_TO_G
             
             print(f"\n✅ Tare Complete:")
-            print(f"   Offset: {tare_offset:.2f} lbs ({tare_offset * 453.592:.1f}g)")
-            print(f"   Stability: ±{tare_stability:.3f} lbs (±{tare_stability * 453.592:.1f}g)")
+            print(f"   Offset: {tare_offset:.2f} lbs ({tare_offset_g:.1f}g)")
+            print(f"   Stability: ±{tare_stability:.3f} lbs (±{tare_stability * LB_TO_G:.1f}g)")
             
             if tare_stability < 0.01:
                 print("   🎯 Excellent stability!")
@@ -68,33 +107,20 @@ def proper_tare_and_read():
             print("-" * 50)
             
             while True:
-                line = ser.readline()
-                if line:
-                    decoded = line.decode('utf-8', errors='ignore').strip()
-                    if ',' in decoded and 'lbs' in decoded:
-                        parts = decoded.split(',')
-                        if len(parts) >= 4 and parts[2] == 'lbs':
-                            try:
-                                reading_num = parts[0]
-                                raw_lbs = float(parts[1])
-                                temp = parts[3]
-                                
-                                # Apply tare
-                                tared_lbs = raw_lbs - tare_offset
-                                weight_grams = tared_lbs * 453.592
-                                
-                                # Format display
-                                if abs(weight_grams) < 5:  # Less than 5g = essentially zero
-                                    display = f"{reading_num:>7} | {raw_lbs:>8.2f} | {tared_lbs:>9.2f} | {'ZERO':>8} | {temp:>7}"
-                                else:
-                                    display = f"{reading_num:>7} | {raw_lbs:>8.2f} | {tared_lbs:>9.2f} | {weight_grams:>7.1f}g | {temp:>7}"
-                                
-                                print(display)
-                                
-                            except (ValueError, IndexError):
-                                pass
-                
-                time.sleep(0.1)
+                for line in drain_lines(ser, rx):
+                    m = LINE_RE.match(line)
+                    if m:
+                        reading_num = m[1].decode('ascii')
+                        raw_lbs = float(m[2])
+                        temp = m[3].decode('ascii')
+                        
+                        # Apply tare
+                        tared_lbs = raw_lbs - tare_offset
+                        weight_grams = raw_lbs * LB_TO_G - tare_offset_g
+                        
+                        # Format display (less than 5g = essentially zero)
+                        is_zero = abs(weight_grams) < 5
+                        print(ROW_FORMATS[is_zero] % (reading_num, raw_lbs, tared_lbs, weight_grams, temp))
                 
     except KeyboardInterrupt:
         print(f"\n\n✅ Session Complete!")
@@ -1,9 +1,33 @@
+import os
+import re
 import serial
 import time
-import statistics
+import numpy as np
 
 PORT = 'COM4'
 BAUDRATE = 9600
+LINE_RE = re.compile(rb'^(\d+),(-?\d+(?:\.\d+)?),lbs,(-?\d+(?:\.\d+)?)')
+LB_TO_G = 453.592
+
+def tune_latency_timer(port):
+    """Drop a Linux USB-serial adapter's latency timer from 16 ms to 1 ms"""
+    path = f'/sys/bus/usb-serial/devices/{os.path.basename(port)}/latency_timer'
+    try:
+        with open(path, 'w') as f:
+            f.write('1')
+    except OSError:
+        pass  # Not Linux, not a USB-serial adapter, or no permission
+
+def drain_lines(ser, buf):
+    """Yield every complete line waiting on the serial port, blocking up to
+    the port timeout for the first byte"""
+    buf += ser.read(ser.in_waiting or 1)
+    end = buf.rfind(b'\n')
+    if end >= 0:
+        # One slice and split per wake; the partial tail stays in buf
+        lines = buf[:end].split(b'\n')
+        del buf[:end + 1]
+        yield from lines
 
 def tare_scale():
     print("=== Taring OpenScale (Setting Zero Point) ===")
@@ -11,7 +35,8 @@ def tare_scale():
     input("Press Enter to tare the scale...")
     
     try:
-        with serial.Serial(PORT, BAUDRATE, timeout=2) as ser:
+        with serial.Serial(PORT, BAUDRATE, timeout=0.05) as ser:
+            tune_latency_timer(PORT)
             print("Recording current readings to set as zero...")
             tare_readings = []
             
@@ -21,42 +46,72 @@ def tare_scale():
                 ser.readline()
             
             # Collect current readings for tare
-            for i in range(15):
-                line = ser.readline()
-                if line:
-                    decoded = line.decode('utf-8', errors='ignore').strip()
-                    if ',' in decoded and decoded.split(',')[0].isdigit():
-                        parts = decoded.split(',')
-                        if len(parts) >= 2:
-                            try:
-                                raw_lbs = float(parts[1])
-                                raw_grams = raw_lbs * 453.592
-                                tare_readings.append(raw_grams)
-                                print(f"Tare reading {i+1}/15: {raw_grams:.1f} grams")
-                            except ValueError:
-                                pass
-                time.sleep(0.2)
+            rx = bytearray()
+            lines_seen = 0
+            deadline = time.time() + 10
+            while lines_seen < 15 and time.time() < deadline:
+                for line in drain_lines(ser, rx):
+                    lines_seen += 1
+                    m = LINE_RE.match(line)
+                    if m:
+                        raw_lbs = float(m[2])
+                        raw_grams = raw_lbs * LB_TO_G
+                        tare_readings.append(raw_grams)
+                        print(f"Tare reading {lines_seen}/15: {raw_grams:.1f} grams")
+                    if lines_seen >= 15:
+                        break
             
             if not tare_readings:
                 print("❌ No valid readings!")
                 return
             
-            tare_point = statistics.mean(tare_readings)
-            tare_std = statistics.stdev(tare_readings) if len(tare_readings) > 1 else 0
+            readings = np.asarray(tare_readings, dtype=np.float64)
+            tare_point = float(readings.mean())
+            tare_std = float(readings.std(ddof=1)) if readings.size > 1 else 0
             
             print(f"\n📊 Tare Results:")
             print(f"   New zero point: {tare_point:.1f} grams")
             print(f"   Stability: {tare_std:.1f} grams")
             
             # Create tared reading script
-            script_content = f'''import serial
+            script_content = f'''import sys
+import os
+import re
+import serial
 import time
 
 PORT = 'COM4'
 BAUDRATE = 9600
+LINE_RE = re.compile(rb'^(\\d+),(-?\\d+(?:\\.\\d+)?),lbs,(-?\\d+(?:\\.\\d+)?)')
 
 # Tared zero point
 TARE_POINT_GRAMS = {tare_point:.6f}
+LB_TO_G = 453.592
+NEG_TARE_G = -TARE_POINT_GRAMS
+
+# Display rows indexed by "is zero"; both take (reading#, grams, temp)
+ROW_FORMATS = ("⚖️  WEIGHT | #%4s | %8.1fg | %6s°C",
+               "🎯 ZERO  | #%4s | %.0s     0.0g | %6s°C")
+
+def tune_latency_timer(port):
+    """Drop a Linux USB-serial adapter's latency timer from 16 ms to 1 ms"""
+    path = f'/sys/bus/usb-serial/devices/{{os.path.basename(port)}}/latency_timer'
+    try:
+        with open(path, 'w') as f:
+            f.write('1')
+    except OSError:
+        pass  # Not Linux, not a USB-serial adapter, or no permission
+
+def drain_lines(ser, buf):
+    """Yield every complete line waiting on the serial port, blocking up to
+    the port timeout for the first byte"""
+    buf += ser.read(ser.in_waiting or 1)
+    end = buf.rfind(b'\\n')
+    if end >= 0:
+        # One slice and split per wake; the partial tail stays in buf
+        lines = buf[:end].split(b'\\n')
+        del buf[:end + 1]
+        yield from lines
 
 def tared_readings():
     print("=== OpenScale - Tared to Zero ===")
@@ -65,39 +120,33 @@ def tared_readings():
     print("Press Ctrl+C to stop")
     print("-" * 40)
     
+    # Console output is flushed once per batch of lines, not on every print
+    sys.stdout.reconfigure(line_buffering=False)
+    
     try:
-        with serial.Serial(PORT, BAUDRATE, timeout=2) as ser:
+        with serial.Serial(PORT, BAUDRATE, timeout=0.05) as ser:
+            tune_latency_timer(PORT)
             # Skip initial messages
             time.sleep(2)
             for _ in range(5):
                 ser.readline()
             
+            rx = bytearray()
+            
             while True:
-                line = ser.readline()
-                if line:
-                    decoded = line.decode('utf-8', errors='ignore').strip()
-                    if ',' in decoded and decoded.split(',')[0].isdigit():
-                        parts = decoded.split(',')
-                        if len(parts) >= 4:
-                            reading_num = parts[0]
-                            raw_lbs = float(parts[1])
-                            temp = parts[3]
-                            
-                            # Convert to grams and subtract tare point
-                            raw_grams = raw_lbs * 453.592
-                            weight_grams = raw_grams - TARE_POINT_GRAMS
-                            
-                            # Display results
-                            if abs(weight_grams) < 5:  # Within 5g, show as zero
-                                status = "🎯 ZERO "
-                                display_weight = 0.0
-                            else:
-                                status = "⚖️  WEIGHT"
-                                display_weight = weight_grams
-                            
-                            print(f"{{status}} | #{{reading_num:>4}} | {{display_weight:>8.1f}}g | {{temp:>6}}°C")
-                
-                time.sleep(0.1)
+                for line in drain_lines(ser, rx):
+                    m = LINE_RE.match(line)
+                    if m:
+                        reading_num = m[1].decode('ascii')
+                        raw_lbs = float(m[2])
+                        temp = m[3].decode('ascii')
+                        
+                        # Convert to grams and subtract tare point
+                        weight_grams = raw_lbs * LB_TO_G + NEG_TARE_G
+                        
+                        # Display results (within 5g shows as zero)
+                        print(ROW_FORMATS[abs(weight_grams) < 5] % (reading_num, weight_grams, temp))
+                sys.stdout.flush()
                 
     except KeyboardInterrupt:
         print("\\n✅ Stopped.")
@@ -1,11 +1,41 @@
+import sys
+import os
+import re
 import serial
 import time
 
 PORT = 'COM4'
 BAUDRATE = 9600
+LINE_RE = re.compile(rb'^(\d+),(-?\d+(?:\.\d+)?),lbs,(-?\d+(?:\.\d+)?)')
 
 # Tared zero point
 TARE_POINT_GRAMS = -15162.975771
+LB_TO_G = 453.592
+NEG_TARE_G = -TARE_POINT_GRAMS
+
+# Display rows indexed by "is zero"; both take (reading#, grams, temp)
+ROW_FORMATS = ("⚖️  WEIGHT | #%4s | %8.1fg | %6s°C",
+               "🎯 ZERO  | #%4s | %.0s     0.0g | %6s°C")
+
+def tune_latency_timer(port):
+    """Drop a Linux USB-serial adapter's latency timer from 16 ms to 1 ms"""
+    path = f'/sys/bus/usb-serial/devices/{os.path.basename(port)}/latency_timer'
+    try:
+        with open(path, 'w') as f:
+            f.write('1')
+    except OSError:
+        pass  # Not Linux, not a USB-serial adapter, or no permission
+
+def drain_lines(ser, buf):
+    """Yield every complete line waiting on the serial port, blocking up to
+    the port timeout for the first byte"""
+    buf += ser.read(ser.in_waiting or 1)
+    end = buf.rfind(b'\n')
+    if end >= 0:
+        # One slice and split per wake; the partial tail stays in buf
+        lines = buf[:end].split(b'\n')
+        del buf[:end + 1]
+        yield from lines
 
 def tared_readings():
     print("=== OpenScale - Tared to Zero ===")
@@ -14,39 +44,33 @@ def tared_readings():
     print("Press Ctrl+C to stop")
     print("-" * 40)
     
+    # Console output is flushed once per batch of lines, not on every print
+    sys.stdout.reconfigure(line_buffering=False)
+    
     try:
-        with serial.Serial(PORT, BAUDRATE, timeout=2) as ser:
+        with serial.Serial(PORT, BAUDRATE, timeout=0.05) as ser:
+            tune_latency_timer(PORT)
             # Skip initial messages
             time.sleep(2)
             for _ in range(5):
                 ser.readline()
             
+            rx = bytearray()
+            
             while True:
-                line = ser.readline()
-                if line:
-                    decoded = line.decode('utf-8', errors='ignore').strip()
-                    if ',' in decoded and decoded.split(',')[0].isdigit():
-                        parts = decoded.split(',')
-                        if len(parts) >= 4:
-                            reading_num = parts[0]
-                            raw_lbs = float(parts[1])
-                            temp = parts[3]
-                            
-                            # Convert to grams and subtract tare point
-                            raw_grams = raw_lbs * 453.592
-                            weight_grams = raw_grams - TARE_POINT_GRAMS
-                            
-                            # Display results
-                            if abs(weight_grams) < 5:  # Within 5g, show as zero
-                                status = "🎯 ZERO "
-                                display_weight = 0.0
-                            else:
-                                status = "⚖️  WEIGHT"
-                                display_weight = weight_grams
-                            
-                            print(f"{status} | #{reading_num:>4} | {display_weight:>8.1f}g | {temp:>6}°C")
-                
-                time.sleep(0.1)
+                for line in drain_lines(ser, rx):
+                    m = LINE_RE.match(line)
+                    if m:
+                        reading_num = m[1].decode('ascii')
+                        raw_lbs = float(m[2])
+                        temp = m[3].decode('ascii')
+                        
+                        # Convert to grams and subtract tare point
+                        weight_grams = raw_lbs * LB_TO_G + NEG_TARE_G
+                        
+                        # Display results (within 5g shows as zero)
+                        print(ROW_FORMATS[abs(weight_grams) < 5] % (reading_num, weight_grams, temp))
+                sys.stdout.flush()
                 
     except KeyboardInterrupt:
         print("\n✅ Stopped.")
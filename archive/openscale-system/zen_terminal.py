@@ -22,57 +22,245 @@ You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
+import heapq
+import math
+import sys
+import os
+import re
 import serial
 import time
-import statistics
 import threading
-import msvcrt
+import queue
+try:
+    import msvcrt
+except ImportError:  # POSIX: watch stdin with a selector instead
+    msvcrt = None
+    import selectors
 from collections import deque
 from datetime import datetime
 from calibration_manager import CalibrationManager
 
 PORT = 'COM4'
 BAUDRATE = 9600
+LINE_RE = re.compile(rb'^(\d+),(-?\d+(?:\.\d+)?),lbs,(-?\d+(?:\.\d+)?)')
+LB_TO_G = 453.592
+
+STATUS_ZERO = "🌸 ZERO"
+STATUS_WEIGHT = "⚖️  WEIGHT"
+STATUS_NEGATIVE = "🔻 NEGATIVE"
+# Display row per status; each takes (reading#, raw lbs, grams, temp, time)
+ROW_FORMATS = {
+    STATUS_ZERO: f"%7s | %8.2f | {STATUS_ZERO:<11} | %.0s    0.0g | %6.1f° | %s",
+    STATUS_WEIGHT: f"%7s | %8.2f | {STATUS_WEIGHT:<11} | %7.1fg | %6.1f° | %s",
+    STATUS_NEGATIVE: f"%7s | %8.2f | {STATUS_NEGATIVE:<11} | %7.1fg | %6.1f° | %s",
+}
+
+def tune_latency_timer(port):
+    """Drop a Linux USB-serial adapter's latency timer from 16 ms to 1 ms"""
+    path = f'/sys/bus/usb-serial/devices/{os.path.basename(port)}/latency_timer'
+    try:
+        with open(path, 'w') as f:
+            f.write('1')
+    except OSError:
+        pass  # Not Linux, not a USB-serial adapter, or no permission
+
+def drain_lines(ser, buf):
+    """Yield every complete line waiting on the serial port, blocking up to
+    the port timeout for the first byte"""
+    buf += ser.read(ser.in_waiting or 1)
+    end = buf.rfind(b'\n')
+    if end >= 0:
+        # One slice and split per wake; the partial tail stays in buf
+        lines = buf[:end].split(b'\n')
+        del buf[:end + 1]
+        yield from lines
+
+if msvcrt:
+    def poll_key():
+        """Return the key pressed since the last call, or '' (non-blocking)"""
+        if msvcrt.kbhit():
+            return msvcrt.getch().decode('utf-8', errors='ignore').lower()
+        return ''
+else:
+    _stdin_selector = selectors.DefaultSelector()
+    _stdin_selector.register(sys.stdin, selectors.EVENT_READ)
+    
+    def poll_key():
+        """Return the first key of a line typed since the last call, or ''
+        (non-blocking; the terminal delivers input on Enter)"""
+        if _stdin_selector.select(0):
+            return sys.stdin.readline()[:1].lower()
+        return ''
+
+def serial_reader(ser, lines):
+    """Background thread: push every data line onto the queue until the
+    port is closed"""
+    rx = bytearray()
+    try:
+        while True:
+            for line in drain_lines(ser, rx):
+                if b',lbs,' in line:  # Firmware chatter never reaches the queue
+                    lines.put(line)
+    except (serial.SerialException, TypeError, OSError):
+        pass
+
+def drain_queue(lines, timeout):
+    """Yield every line queued by the reader thread, waiting up to timeout
+    for the first one"""
+    try:
+        yield lines.get(timeout=timeout)
+        while True:
+            yield lines.get_nowait()
+    except queue.Empty:
+        return
+
+class RollingMedian:
+    """Median of a sliding window kept in two heaps with lazy deletion"""
+    
+    def __init__(self, window):
+        self.window = deque(maxlen=window)
+        self.low = []   # Max-heap (negated) of the lower half
+        self.high = []  # Min-heap of the upper half
+        self.low_size = 0
+        self.high_size = 0
+        self.delayed = {}  # Evicted values still sitting in a heap
+        
+    def __len__(self):
+        return len(self.window)
+    
+    def add(self, value):
+        """Push a new value, evicting the oldest once the window is full"""
+        if len(self.window) == self.window.maxlen:
+            self._discard(self.window[0])
+        self.window.append(value)
+        
+        if not self.low_size or value <= -self.low[0]:
+            heapq.heappush(self.low, -value)
+            self.low_size += 1
+        else:
+            heapq.heappush(self.high, value)
+            self.high_size += 1
+        self._rebalance()
+        
+        # Evicted values can sink below the heap tops and never get pruned
+        # (e.g. on a steady drift), so rebuild once they pile up
+        if len(self.low) + len(self.high) > 4 * self.window.maxlen:
+            self._rebuild()
+    
+    def median(self):
+        if self.low_size > self.high_size:
+            return -self.low[0]
+        return (-self.low[0] + self.high[0]) / 2
+    
+    def _discard(self, value):
+        self.delayed[value] = self.delayed.get(value, 0) + 1
+        if value <= -self.low[0]:
+            self.low_size -= 1
+            if value == -self.low[0]:
+                self._prune(self.low, -1)
+        else:
+            self.high_size -= 1
+            if value == self.high[0]:
+                self._prune(self.high, 1)
+        self._rebalance()
+    
+    def _prune(self, heap, sign):
+        # Drop evicted values from the top of a heap
+        while heap:
+            value = sign * heap[0]
+            count = self.delayed.get(value)
+            if not count:
+                break
+            if count == 1:
+                del self.delayed[value]
+            else:
+                self.delayed[value] = count - 1
+            heapq.heappop(heap)
+    
+    def _rebuild(self):
+        ordered = sorted(self.window)
+        half = (len(ordered) + 1) // 2
+        self.low = [-value for value in ordered[:half]]
+        heapq.heapify(self.low)
+        self.high = ordered[half:]
+        self.low_size = len(self.low)
+        self.high_size = len(self.high)
+        self.delayed.clear()
+    
+    def _rebalance(self):
+        if self.low_size > self.high_size + 1:
+            heapq.heappush(self.high, -heapq.heappop(self.low))
+            self.low_size -= 1
+            self.high_size += 1
+            self._prune(self.low, -1)
+        elif self.low_size < self.high_size:
+            heapq.heappush(self.low, -heapq.heappop(self.high))
+            self.high_size -= 1
+            self.low_size += 1
+            self._prune(self.high, 1)
 
 class ZenScale:
     def __init__(self):
         # Load calibration from persistent storage
         self.cal_manager = CalibrationManager()
         self.calibration_data = self.cal_manager.load_calibration()
-        self.readings_buffer = deque(maxlen=10)  # Rolling average
-        self.session_weights = []
+        self.readings_buffer = RollingMedian(10)  # Rolling median
+        self.session_count = 0
+        # Running stats of non-zero weights (Welford)
+        self.weight_count = 0
+        self.weight_mean = 0.0
+        self.weight_m2 = 0.0
+        self.weight_min = math.inf
+        self.weight_max = -math.inf
         self.session_start_time = datetime.now()
+        self._update_coefficients()
+        # Bound once; process_reading runs for every sample
+        self._add_reading = self.readings_buffer.add
+        self._median = self.readings_buffer.median
+        
+    def _update_coefficients(self):
+        """Fold lbs-to-grams, tare and scale factor into one multiply-add"""
+        tare_offset = self.calibration_data.get("tare_offset", 0.0)
+        scale_factor = self.calibration_data.get("scale_factor", 1.0) or 1.0
+        self._gain = LB_TO_G / scale_factor
+        self._offset = -tare_offset / scale_factor
         
     def process_reading(self, raw_lbs, temp):
         """Process a raw reading with Zen-like precision"""
-        # Convert to grams
-        raw_grams = raw_lbs * 453.592
-        
-        # Apply calibration (tare and scale factor)
-        weight_grams = self.cal_manager.apply_calibration(raw_grams, self.calibration_data)
+        # Convert to grams and apply calibration (tare and scale factor)
+        weight_grams = raw_lbs * self._gain + self._offset
         
         # Add to rolling buffer
-        self.readings_buffer.append(weight_grams)
+        self._add_reading(weight_grams)
         
         # Calculate smoothed reading
         if len(self.readings_buffer) >= 3:
-            smoothed = statistics.median(self.readings_buffer)
+            smoothed = self._median()
         else:
             smoothed = weight_grams
             
         # Zero detection with hysteresis
         if abs(smoothed) < 10:  # 10g threshold
             display_weight = 0.0
-            status = "🌸 ZERO"
+            status = STATUS_ZERO
         else:
             display_weight = smoothed
             if display_weight > 0:
-                status = "⚖️  WEIGHT"
+                status = STATUS_WEIGHT
             else:
-                status = "🔻 NEGATIVE"
+                status = STATUS_NEGATIVE
             
-        # Add to session data
-        self.session_weights.append(display_weight)
+        # Add to session stats
+        self.session_count += 1
+        if abs(display_weight) > 5:
+            self.weight_count += 1
+            delta = display_weight - self.weight_mean
+            self.weight_mean += delta / self.weight_count
+            self.weight_m2 += delta * (display_weight - self.weight_mean)
+            if display_weight < self.weight_min:
+                self.weight_min = display_weight
+            if display_weight > self.weight_max:
+                self.weight_max = display_weight
             
         return display_weight, status, temp
     
@@ -83,6 +271,7 @@ class ZenScale:
         # Save new calibration
         if self.cal_manager.save_calibration(calibration_data):
             self.calibration_data = calibration_data
+            self._update_coefficients()
             return True
         return False
 
@@ -116,16 +305,16 @@ def show_calibration_info(scale):
 
 def show_statistics(scale):
     """Display session statistics with kawaii styling"""
-    if scale.session_weights:
-        non_zero_weights = [w for w in scale.session_weights if abs(w) > 5]
-        if non_zero_weights:
+    if scale.session_count:
+        if scale.weight_count:
             print(f"\n📊 Session Statistics ~ UwU:")
-            print(f"   📉 Minimum: {min(non_zero_weights):>8.1f}g")
-            print(f"   📈 Maximum: {max(non_zero_weights):>8.1f}g") 
-            print(f"   📊 Average: {statistics.mean(non_zero_weights):>8.1f}g")
-            if len(non_zero_weights) > 1:
-                print(f"   📏 Std Dev: {statistics.stdev(non_zero_weights):>8.1f}g")
-            print(f"   🔢 Readings: {len(scale.session_weights):>8}")
+            print(f"   📉 Minimum: {scale.weight_min:>8.1f}g")
+            print(f"   📈 Maximum: {scale.weight_max:>8.1f}g") 
+            print(f"   📊 Average: {scale.weight_mean:>8.1f}g")
+            if scale.weight_count > 1:
+                std_dev = math.sqrt(scale.weight_m2 / (scale.weight_count - 1))
+                print(f"   📏 Std Dev: {std_dev:>8.1f}g")
+            print(f"   🔢 Readings: {scale.session_count:>8}")
             
             # Session duration
             duration = datetime.now() - scale.session_start_time
@@ -148,26 +337,42 @@ def zen_scale_monitor():
     
     calibration_request = False
     
+    # Console output is flushed once per batch of lines, not on every print
+    sys.stdout.reconfigure(line_buffering=False)
+    
     try:
-        with serial.Serial(PORT, BAUDRATE, timeout=2) as ser:
+        with serial.Serial(PORT, BAUDRATE, timeout=0.05) as ser:
+            tune_latency_timer(PORT)
             # Skip startup messages
             time.sleep(2)
             for _ in range(10):
                 ser.readline()
             
+            # Read on a background thread so bursts are queued at the port's pace
+            lines = queue.SimpleQueue()
+            threading.Thread(target=serial_reader, args=(ser, lines), daemon=True).start()
             reading_count = 0
+            last_second = 0
+            current_time = ''
+            
+            loop_count = 0
+            
+            # Hot-loop lookups bound to locals
+            key_pressed = poll_key
+            match_line = LINE_RE.match
+            process = scale.process_reading
+            clock = time.time
             
             while True:
-                # Check for user input (Windows compatible)
-                if msvcrt.kbhit():
-                    key = msvcrt.getch().decode('utf-8').lower()
-                    if key == 'c':
-                        calibration_request = True
+                # Check for user input every 8th pass; keystrokes are slow
+                loop_count += 1
+                if loop_count & 0x7 == 0 and key_pressed() == 'c':
+                    calibration_request = True
                 
                 # Handle calibration request
                 if calibration_request:
                     print(f"\n🌸 Calibration requested! 🌸")
-                    if interactive_calibration(scale, ser):
+                    if interactive_calibration(scale, lines):
                         print("✅ Calibration complete! Resuming monitoring...")
                         show_calibration_info(scale)
                         print("-" * 80)
@@ -178,44 +383,42 @@ def zen_scale_monitor():
                         print("-" * 80)
                     calibration_request = False
                 
-                line = ser.readline()
-                if line:
-                    decoded = line.decode('utf-8', errors='ignore').strip()
-                    if ',' in decoded and 'lbs' in decoded:
-                        parts = decoded.split(',')
-                        if len(parts) >= 4 and parts[2] == 'lbs':
-                            try:
-                                reading_num = parts[0]
-                                raw_lbs = float(parts[1])
-                                temp = float(parts[3])
-                                
-                                # Process with kawaii precision
-                                display_weight, status, temperature = scale.process_reading(raw_lbs, temp)
-                                
-                                # Current time
-                                current_time = datetime.now().strftime('%H:%M:%S')
-                                
-                                # Display with kawaii aesthetics
-                                if "ZERO" in status:
-                                    weight_display = "    0.0"
-                                else:
-                                    weight_display = f"{display_weight:7.1f}"
-                                
-                                print(f"{reading_num:>7} | {raw_lbs:>8.2f} | {status:<11} | {weight_display}g | {temperature:>6.1f}° | {current_time}")
-                                
-                                reading_count += 1
-                                
-                                # Periodic statistics display
-                                if reading_count % 100 == 0:
-                                    show_statistics(scale)
-                                    print("-" * 80)
-                                
-                            except (ValueError, IndexError):
-                                pass
+                for line in drain_queue(lines, 0.05):
+                    m = match_line(line)
+                    if m:
+                        reading_num = m[1].decode('ascii')
+                        raw_lbs = float(m[2])
+                        temp = float(m[3])
+                        
+                        # Process with kawaii precision
+                        display_weight, status, temperature = process(raw_lbs, temp)
+                        
+                        # Current time, formatted once per second
+                        now = clock()
+                        if int(now) != last_second:
+                            last_second = int(now)
+                            current_time = datetime.fromtimestamp(now).strftime('%H:%M:%S')
+                        
+                        # Display with kawaii aesthetics
+                        print(ROW_FORMATS[status] % (reading_num, raw_lbs, display_weight, temperature, current_time))
+                        
+                        reading_count += 1
+                        
+                        # Periodic statistics display
+                        if reading_count % 100 == 0:
+                            show_statistics(scale)
+                            print("-" * 80)
+                sys.stdout.flush()
                 
-                time.sleep(0.1)
+    except KeyboardInterrupt:
+        print(f"\n\n🌸 Kawaii Session Complete! >w< 🌸")
+        show_statistics(scale)
+        print(f"\n🙏 Thank you for using Force Monitor! UwU 🙏")
+        print("=" * 80)
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
 
-def interactive_calibration(scale, ser):
+def interactive_calibration(scale, lines):
     """Interactive calibration routine"""
     print(f"\n🌸 Kawaii Calibration Mode 🌸")
     print("Make sure the load cell is empty and stable!")
@@ -230,26 +433,24 @@ def interactive_calibration(scale, ser):
     calibration_readings = []
     
     try:
-        for i in range(20):
-            line = ser.readline()
-            if line:
-                decoded = line.decode('utf-8', errors='ignore').strip()
-                if ',' in decoded and 'lbs' in decoded:
-                    parts = decoded.split(',')
-                    if len(parts) >= 4 and parts[2] == 'lbs':
-                        try:
-                            raw_lbs = float(parts[1])
-                            raw_grams = raw_lbs * 453.592
-                            calibration_readings.append(raw_grams)
-                            print(f"  📍 Reading {i+1}/20: {raw_grams:.2f}g")
-                        except (ValueError, IndexError):
-                            pass
-            time.sleep(0.3)
+        lines_seen = 0
+        deadline = time.time() + 10
+        while lines_seen < 20 and time.time() < deadline:
+            for line in drain_queue(lines, 0.05):
+                lines_seen += 1
+                m = LINE_RE.match(line)
+                if m:
+                    raw_lbs = float(m[2])
+                    raw_grams = raw_lbs * LB_TO_G
+                    calibration_readings.append(raw_grams)
+                    print(f"  📍 Reading {lines_seen}/20: {raw_grams:.2f}g")
+                if lines_seen >= 20:
+                    break
         
         if len(calibration_readings) >= 10:
             success = scale.recalibrate_tare(calibration_readings)
             if success:
-                stability = statistics.stdev(calibration_readings)
+                stability = scale.calibration_data['calibration_stability']
                 print(f"\n✅ Calibration Complete!")
                 print(f"   📊 New tare offset: {scale.calibration_data['tare_offset']:.2f}g")
                 print(f"   📏 Stability: ±{stability:.2f}g")
@@ -265,14 +466,6 @@ def interactive_calibration(scale, ser):
     except Exception as e:
         print(f"❌ Calibration error: {e}")
         return False
-                
-    except KeyboardInterrupt:
-        print(f"\n\n🌸 Kawaii Session Complete! >w< 🌸")
-        show_statistics(scale)
-        print(f"\n🙏 Thank you for using Force Monitor! UwU 🙏")
-        print("=" * 80)
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
 
 if __name__ == "__main__":
     zen_scale_monitor()
@@ -14,91 +14,180 @@ the Free Software Foundation, either version 3 of the License, or
 (at your option) any later version.
 """
 
+import bisect
+import copy
 import json
+import logging
+import math
 import os
-import statistics
+import types
+import numpy as np
 from datetime import datetime
 from typing import Dict, Optional, List
 
+log = logging.getLogger(__name__)
+
+# Calibration file layout; files written at this version carry every default key
+CURRENT_VERSION = "1.1"
+
+N_TO_GRAMS_FORCE = 101.97  # 1 N = 101.97 grams-force
+
+# Voltage stability grades (different thresholds than weight): below 1mV,
+# 5mV, 20mV, and anything above
+STABILITY_EDGES = (0.001, 0.005, 0.02)
+STABILITY_LABELS = ("🟢 Excellent", "🟡 Good", "🟠 Fair", "🔴 Poor")
+
+# Default calibration; dict(_DEFAULT_ITEMS) builds a fresh, unshared copy
+_DEFAULT_ITEMS = (
+    ("tare_voltage", 0.5),  # Default minimum voltage
+    ("max_force_newtons", 100.0),  # Maximum force in Newtons
+    ("voltage_min", 0.5),   # FC2231 minimum output voltage
+    ("voltage_max", 4.5),   # FC2231 maximum output voltage
+    ("calibration_date", None),
+    ("calibration_stability", None),
+    ("known_force_calibration", None),  # For multi-point calibration
+    ("lut", None),  # Optional {"v": [...], "f": [...]} nonlinear response table
+    ("serial_port", "COM3"),  # Default Arduino COM port
+    ("arduino_board", "Uno R3"),
+    ("sensor_model", "FC2231"),
+    ("version", CURRENT_VERSION),
+)
+
 class FC2231CalibrationManager:
     """Manages persistent calibration data for FC2231 force sensors"""
     
+    # (key, accepted types, lowest, highest) for every required value
+    _CHECKS = (
+        ("tare_voltage", (int, float), 0.4, 5.0),
+        ("max_force_newtons", (int, float), 1e-9, 10000),  # Reasonable force limits
+        ("voltage_min", (int, float), 0.0, 5.0),
+        ("voltage_max", (int, float), 0.0, 5.0),
+    )
+    
     def __init__(self, calibration_file: str = "fc2231_calibration.json"):
         self.calibration_file = calibration_file
-        self.default_calibration = {
-            "tare_voltage": 0.5,  # Default minimum voltage
-            "max_force_newtons": 100.0,  # Maximum force in Newtons
-            "voltage_min": 0.5,   # FC2231 minimum output voltage
-            "voltage_max": 4.5,   # FC2231 maximum output voltage
-            "calibration_date": None,
-            "calibration_stability": None,
-            "known_force_calibration": None,  # For multi-point calibration
-            "serial_port": "COM3",  # Default Arduino COM port
-            "arduino_board": "Uno R3",
-            "sensor_model": "FC2231",
-            "version": "1.0"
-        }
+        # Read-only view, so no caller can change the defaults for everyone
+        self.default_calibration = types.MappingProxyType(dict(_DEFAULT_ITEMS))
+        # Last parsed file, keyed by (mtime_ns, size) so an unchanged file
+        # is never re-read
+        self._cache = {}
+        # Private copy of the calibration last loaded or saved
+        self._last_loaded = None
+        # Calibration dict whose conversion constants are precomputed below
+        self._applied = None
+        # (calibration_date string, parsed datetime) from the last status check
+        self._cal_date_cache = (None, None)
         
     def load_calibration(self) -> Dict:
         """Load calibration data from file, create default if not exists"""
         try:
             if os.path.exists(self.calibration_file):
-                with open(self.calibration_file, 'r') as f:
-                    data = json.load(f)
+                st = os.stat(self.calibration_file)
+                file_key = (st.st_mtime_ns, st.st_size)
+                if self._cache.get('key') == file_key:
+                    data = copy.deepcopy(self._cache['data'])
+                else:
+                    with open(self.calibration_file, 'r') as f:
+                        data = json.load(f)
                     
-                # Validate and update structure if needed
-                for key, default_value in self.default_calibration.items():
-                    if key not in data:
-                        data[key] = default_value
+                    # Validate and update structure if needed (older layouts only)
+                    if data.get("version") != CURRENT_VERSION or len(data) < len(_DEFAULT_ITEMS):
+                        for key, default_value in _DEFAULT_ITEMS:
+                            data.setdefault(key, default_value)
+                        data["version"] = CURRENT_VERSION
+                    
+                    self._cache = {'key': file_key, 'data': copy.deepcopy(data)}
+                self._last_loaded = self._cache['data']
                 
-                print(f"✅ Loaded FC2231 calibration from {self.calibration_file}")
-                print(f"   📅 Calibrated: {data['calibration_date'] or 'Never'}")
-                print(f"   ⚡ Tare voltage: {data['tare_voltage']:.4f}V")
-                print(f"   💪 Max force: {data['max_force_newtons']:.1f}N")
-                return data
+                log.info("✅ Loaded FC2231 calibration from %s", self.calibration_file)
+                log.info("   📅 Calibrated: %s", data['calibration_date'] or 'Never')
+                log.info("   ⚡ Tare voltage: %.4fV", data['tare_voltage'])
+                log.info("   💪 Max force: %.1fN", data['max_force_newtons'])
             else:
-                print(f"⚠️  No FC2231 calibration file found, using defaults")
-                return self.default_calibration.copy()
+                log.warning("⚠️  No FC2231 calibration file found, using defaults")
+                data = dict(_DEFAULT_ITEMS)
+            self.apply_calibration(data)
+            return data
                 
         except Exception as e:
-            print(f"❌ Error loading FC2231 calibration: {e}")
-            print("🔄 Using default calibration")
-            return self.default_calibration.copy()
+            log.error("❌ Error loading FC2231 calibration: %s", e)
+            log.error("🔄 Using default calibration")
+            data = dict(_DEFAULT_ITEMS)
+            self.apply_calibration(data)
+            return data
     
     def save_calibration(self, calibration_data: Dict) -> bool:
         """Save calibration data to file"""
         try:
             # Add timestamp
             calibration_data["calibration_date"] = datetime.now().isoformat()
-            calibration_data["version"] = "1.0"
+            calibration_data["version"] = CURRENT_VERSION
+            
+            # Encode up front (json.dump would issue one write per token) and
+            # write the file in a single call
+            payload = json.dumps(calibration_data, indent=4)
             
-            with open(self.calibration_file, 'w') as f:
-                json.dump(calibration_data, f, indent=4)
+            # Write beside the target and rename over it, so a crash mid-write
+            # leaves the previous calibration intact rather than a torn file
+            tmp_file = self.calibration_file + ".tmp"
+            try:
+                with open(tmp_file, 'w') as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.calibration_file)
+            except OSError:
+                # Don't leave a half-written temporary file behind
+                try:
+                    os.remove(tmp_file)
+                except OSError:
+                    pass
+                raise
             
-            print(f"✅ FC2231 calibration saved to {self.calibration_file}")
+            # What we just wrote is what the next load would parse
+            st = os.stat(self.calibration_file)
+            self._cache = {'key': (st.st_mtime_ns, st.st_size),
+                           'data': copy.deepcopy(calibration_data)}
+            self._last_loaded = self._cache['data']
+            self.apply_calibration(calibration_data)
+            
+            log.info("✅ FC2231 calibration saved to %s", self.calibration_file)
             return True
             
         except Exception as e:
-            print(f"❌ Error saving FC2231 calibration: {e}")
+            log.error("❌ Error saving FC2231 calibration: %s", e)
             return False
     
+    @staticmethod
+    def _mean_stdev(readings: np.ndarray):
+        """Mean and sample standard deviation, computing the mean only once
+        (std() would take it again internally)"""
+        mean = readings.mean()
+        deviations = readings - mean
+        return float(mean), float(np.sqrt(np.dot(deviations, deviations) / (readings.size - 1)))
+    
     def perform_voltage_tare(self, voltage_readings: List[float]) -> Dict:
         """Perform tare calibration using voltage readings"""
-        if len(voltage_readings) < 5:
+        readings = np.asarray(voltage_readings, dtype=np.float64)
+        if readings.size < 5:
             raise ValueError("Need at least 5 voltage readings for calibration")
         
         # Calculate statistics
-        tare_voltage = statistics.mean(voltage_readings)
-        stability = statistics.stdev(voltage_readings)
+        tare_voltage, stability = self._mean_stdev(readings)
         
-        # Load existing calibration and update tare
-        calibration_data = self.load_calibration()
+        # Start from the calibration loaded (or saved) this session and update
+        # the tare; only go to disk if nothing has been loaded yet
+        if self._last_loaded is None:
+            calibration_data = self.load_calibration()
+        else:
+            calibration_data = copy.deepcopy(self._last_loaded)
         calibration_data.update({
             "tare_voltage": tare_voltage,
             "calibration_date": datetime.now().isoformat(),
             "calibration_stability": stability,
-            "version": "1.0"
+            "version": CURRENT_VERSION
         })
+        self.apply_calibration(calibration_data)
         
         return calibration_data
     
@@ -106,12 +195,14 @@ class FC2231CalibrationManager:
                                  loaded_voltages: List[float], 
                                  known_force_newtons: float) -> Dict:
         """Perform full force calibration with known weight"""
-        if len(empty_voltages) < 5 or len(loaded_voltages) < 5:
+        empty = np.asarray(empty_voltages, dtype=np.float64)
+        loaded = np.asarray(loaded_voltages, dtype=np.float64)
+        if empty.size < 5 or loaded.size < 5:
             raise ValueError("Need at least 5 readings for each state")
         
-        # Calculate baselines
-        empty_voltage = statistics.mean(empty_voltages)
-        loaded_voltage = statistics.mean(loaded_voltages)
+        # Calculate baselines and stability
+        empty_voltage, empty_stability = self._mean_stdev(empty)
+        loaded_voltage, loaded_stability = self._mean_stdev(loaded)
         
         # Calculate voltage change per Newton
         voltage_change = loaded_voltage - empty_voltage
@@ -121,58 +212,112 @@ class FC2231CalibrationManager:
         voltage_range = 4.5 - empty_voltage  # From tare to max voltage
         max_force = voltage_range / voltage_per_newton if voltage_per_newton != 0 else 100.0
         
-        # Calculate stability
-        empty_stability = statistics.stdev(empty_voltages)
-        loaded_stability = statistics.stdev(loaded_voltages)
         overall_stability = max(empty_stability, loaded_stability)
         
-        # Create calibration data
-        calibration_data = {
-            "tare_voltage": empty_voltage,
-            "max_force_newtons": max_force,
-            "voltage_min": 0.5,
-            "voltage_max": 4.5,
-            "calibration_date": datetime.now().isoformat(),
-            "calibration_stability": overall_stability,
-            "known_force_calibration": {
+        # Create calibration data on top of the defaults
+        calibration_data = dict(_DEFAULT_ITEMS)
+        calibration_data.update(
+            tare_voltage=empty_voltage,
+            max_force_newtons=max_force,
+            calibration_date=datetime.now().isoformat(),
+            calibration_stability=overall_stability,
+            known_force_calibration={
                 "force_newtons": known_force_newtons,
                 "voltage_change": voltage_change,
                 "voltage_per_newton": voltage_per_newton
             },
-            "serial_port": "COM4",
-            "arduino_board": "Uno R3",
-            "sensor_model": "FC2231",
-            "version": "1.0"
-        }
+            serial_port="COM4",
+        )
+        self.apply_calibration(calibration_data)
         
         return calibration_data
     
-    def voltage_to_force(self, voltage: float, calibration_data: Dict) -> float:
-        """Convert voltage reading to force in Newtons"""
-        tare_voltage = calibration_data.get("tare_voltage", 0.5)
-        max_force = calibration_data.get("max_force_newtons", 100.0)
+    def apply_calibration(self, calibration_data: Dict):
+        """Precompute the conversion constants for a calibration. Loading,
+        saving and taring do this for the dict they return or store, and
+        conversions do it for any other dict; call it again after editing
+        one in place"""
         voltage_min = calibration_data.get("voltage_min", 0.5)
         voltage_max = calibration_data.get("voltage_max", 4.5)
+        max_force = calibration_data.get("max_force_newtons", 100.0)
+        self._tare = calibration_data.get("tare_voltage", 0.5)
+        self._vmin = voltage_min
+        self._vmax = voltage_max
+        self._scale = max_force / (voltage_max - voltage_min)  # Newtons per volt
+        self._scale_g = self._scale * N_TO_GRAMS_FORCE  # Grams-force per volt
+        # Piecewise-linear table of tared voltage (ascending) to Newtons,
+        # replacing the straight line when a sensor's response curves
+        lut = calibration_data.get("lut")
+        if lut:
+            self._lut_v = [float(v) for v in lut["v"]]
+            self._lut_f = [float(f) for f in lut["f"]]
+        else:
+            self._lut_v = None
+        self._applied = calibration_data
+    
+    def voltage_to_force(self, voltage: float, calibration_data: Dict) -> float:
+        """Convert voltage reading to force in Newtons"""
+        if calibration_data is not self._applied:
+            self.apply_calibration(calibration_data)
+        voltage_min = self._vmin
         
-        # Apply tare
-        adjusted_voltage = voltage - tare_voltage + voltage_min
+        # Apply tare and clamp to valid range
+        adjusted_voltage = min(self._vmax, max(voltage_min, voltage - self._tare + voltage_min))
         
-        # Clamp to valid range
-        if adjusted_voltage < voltage_min:
-            adjusted_voltage = voltage_min
-        if adjusted_voltage > voltage_max:
-            adjusted_voltage = voltage_max
+        if self._lut_v is not None:
+            return self._lut_force(adjusted_voltage)
         
         # Linear conversion
-        voltage_range = voltage_max - voltage_min
-        voltage_ratio = (adjusted_voltage - voltage_min) / voltage_range
-        force_newtons = voltage_ratio * max_force
+        return (adjusted_voltage - voltage_min) * self._scale
+    
+    def _lut_force(self, voltage: float) -> float:
+        """Interpolate the calibration table (held flat beyond its ends)"""
+        lut_v = self._lut_v
+        lut_f = self._lut_f
+        i = bisect.bisect_right(lut_v, voltage)
+        if i == 0:
+            return lut_f[0]
+        if i == len(lut_v):
+            return lut_f[-1]
+        v0 = lut_v[i - 1]
+        f0 = lut_f[i - 1]
+        return f0 + (voltage - v0) * (lut_f[i] - f0) / (lut_v[i] - v0)
+    
+    def voltage_to_force_array(self, voltages, calibration_data: Dict) -> np.ndarray:
+        """Convert an array of voltage readings to forces in Newtons"""
+        if calibration_data is not self._applied:
+            self.apply_calibration(calibration_data)
         
-        return force_newtons
+        # Same tare, clamp and linear scaling as voltage_to_force, applied
+        # to the whole array at once
+        adjusted = np.clip(np.asarray(voltages, dtype=np.float64) - self._tare + self._vmin,
+                           self._vmin, self._vmax)
+        if self._lut_v is not None:
+            return np.interp(adjusted, self._lut_v, self._lut_f)
+        return (adjusted - self._vmin) * self._scale
+    
+    def voltage_to_grams_array(self, voltages, calibration_data: Dict) -> np.ndarray:
+        """Convert an array of voltage readings straight to grams-force"""
+        if calibration_data is not self._applied:
+            self.apply_calibration(calibration_data)
+        if self._lut_v is not None:
+            return self.voltage_to_force_array(voltages, calibration_data) * N_TO_GRAMS_FORCE
+        
+        # Tare, clamp and scale in place on one output array, with the
+        # Newton and gram-force factors folded into a single multiply
+        grams = np.subtract(voltages, self._tare - self._vmin, dtype=np.float64)
+        np.clip(grams, self._vmin, self._vmax, out=grams)
+        grams -= self._vmin
+        grams *= self._scale_g
+        return grams
     
     def force_to_grams(self, force_newtons: float) -> float:
         """Convert force from Newtons to grams-force"""
-        return force_newtons * 101.97  # 1 N = 101.97 grams-force
+        return force_newtons * N_TO_GRAMS_FORCE
+    
+    def force_to_grams_array(self, forces_newtons) -> np.ndarray:
+        """Convert an array of forces from Newtons to grams-force"""
+        return np.asarray(forces_newtons, dtype=np.float64) * N_TO_GRAMS_FORCE
     
     def get_calibration_status(self, calibration_data: Dict) -> str:
         """Get human-readable calibration status"""
@@ -180,7 +325,12 @@ class FC2231CalibrationManager:
             return "❌ Never calibrated"
         
         try:
-            cal_date = datetime.fromisoformat(calibration_data["calibration_date"])
+            date_str = calibration_data["calibration_date"]
+            if date_str == self._cal_date_cache[0]:
+                cal_date = self._cal_date_cache[1]
+            else:
+                cal_date = datetime.fromisoformat(date_str)
+                self._cal_date_cache = (date_str, cal_date)
             days_ago = (datetime.now() - cal_date).days
             
             stability = calibration_data.get("calibration_stability", float('inf'))
@@ -197,15 +347,8 @@ class FC2231CalibrationManager:
             else:
                 age_status = f"{days_ago//30} months ago"
             
-            # Stability assessment for voltage (different thresholds than weight)
-            if stability < 0.001:  # 1mV
-                stability_status = "🟢 Excellent"
-            elif stability < 0.005:  # 5mV
-                stability_status = "🟡 Good"
-            elif stability < 0.02:   # 20mV
-                stability_status = "🟠 Fair"
-            else:
-                stability_status = "🔴 Poor"
+            # Stability assessment for voltage
+            stability_status = STABILITY_LABELS[bisect.bisect_right(STABILITY_EDGES, stability)]
             
             return f"✅ Calibrated {age_status} | {stability_status} stability"
             
@@ -214,31 +357,37 @@ class FC2231CalibrationManager:
     
     def validate_calibration(self, calibration_data: Dict) -> bool:
         """Validate calibration data integrity"""
-        required_keys = ["tare_voltage", "max_force_newtons", "voltage_min", "voltage_max"]
-        
-        for key in required_keys:
-            if key not in calibration_data:
+        for key, expected_types, lowest, highest in self._CHECKS:
+            value = calibration_data.get(key)  # Missing keys fail the type check
+            if type(value) not in expected_types or not lowest <= value <= highest:
                 return False
         
-        # Check for reasonable values
-        tare_voltage = calibration_data["tare_voltage"]
-        max_force = calibration_data["max_force_newtons"]
-        
-        if not isinstance(tare_voltage, (int, float)) or not isinstance(max_force, (int, float)):
+        # The conversion divides by the output voltage span
+        if not calibration_data["voltage_min"] < calibration_data["voltage_max"]:
             return False
         
-        # Validate voltage range
-        if tare_voltage < 0.4 or tare_voltage > 5.0:
+        # Optional response table: at least two points, equal-length numeric
+        # lists, and strictly increasing voltages (bisect and np.interp both
+        # assume it and silently return wrong forces otherwise)
+        lut = calibration_data.get("lut")
+        if lut is None:
+            return True
+        if type(lut) is not dict:
             return False
-        
-        # Validate force range
-        if max_force <= 0 or max_force > 10000:  # Reasonable force limits
+        lut_v = lut.get("v")
+        lut_f = lut.get("f")
+        if type(lut_v) is not list or type(lut_f) is not list:
             return False
-        
-        return True
+        if len(lut_v) < 2 or len(lut_v) != len(lut_f):
+            return False
+        for value in lut_v + lut_f:
+            if type(value) not in (int, float) or not math.isfinite(value):
+                return False
+        return all(v0 < v1 for v0, v1 in zip(lut_v, lut_v[1:]))
 
 if __name__ == "__main__":
     # Test the FC2231 calibration manager
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     print("🌸 Testing FC2231 Calibration Manager 🌸")
     
     cal_manager = FC2231CalibrationManager()
@@ -248,9 +397,9 @@ if __name__ == "__main__":
     print(f"\nStatus: {cal_manager.get_calibration_status(cal_data)}")
     
     # Test voltage to force conversion
-    test_voltages = [0.5, 1.0, 2.0, 3.0, 4.5]
+    test_voltages = np.array([0.5, 1.0, 2.0, 3.0, 4.5])
     print(f"\n📊 Voltage to Force Conversion Test:")
-    for voltage in test_voltages:
-        force_n = cal_manager.voltage_to_force(voltage, cal_data)
+    forces_n = cal_manager.voltage_to_force_array(test_voltages, cal_data)
+    for voltage, force_n in zip(test_voltages, forces_n):
         force_g = cal_manager.force_to_grams(force_n)
         print(f"  {voltage:.1f}V → {force_n:.2f}N ({force_g:.1f}g)")
\ No newline at end of file
@@ -14,19 +14,171 @@ the Free Software Foundation, either version 3 of the License, or
 (at your option) any later version.
 """
 
+import heapq
+import re
 import serial
 import time
-import statistics
+import math
+import threading
+import queue
 import msvcrt
-import csv
 from collections import deque
 from datetime import datetime
-from fc2231_calibration_manager import FC2231CalibrationManager
+from fc2231_calibration_manager import FC2231CalibrationManager, N_TO_GRAMS_FORCE
 
 # Default Arduino connection (adjust if needed)
 PORT = 'COM5'  # Arduino detected on COM5
 BAUDRATE = 9600
 
+# Data line: reading,voltage,V,temp,force_N,N,force_g,g,timestamp
+# Groups are reading, voltage and temperature; command responses
+# ("FC2231,...") and partial lines don't match
+LINE_RE = re.compile(rb'^(\d+),(-?\d+(?:\.\d+)?),V,([^,]*),[^,]*,N,[^,]*,g,\d+')
+
+# CSV export columns, in the order rows are recorded
+EXPORT_COLUMNS = ('Reading#', 'DateTime', 'Time', 'Voltage(V)',
+                  'Force(N)', 'Force(g)', 'Temperature(°C)', 'Status')
+# One preformatted CSV line per reading; no field can contain a comma or quote
+EXPORT_ROW = "%s,%s.%03d,%s,%.4f,%.3f,%.1f,%.1f,%s\r\n"
+
+# Force status as (display text, CSV text)
+STATUS_ZERO = ("🌸 ZERO", "ZERO")
+STATUS_LIGHT = ("⚖️  LIGHT", "LIGHT")
+STATUS_MEDIUM = ("💪 MEDIUM", "MEDIUM")
+STATUS_STRONG = ("🔥 STRONG", "STRONG")
+STATUS_NEGATIVE = ("🔻 NEGATIVE", "NEGATIVE")
+
+def force_status(force):
+    """Classify a smoothed force reading"""
+    if abs(force) < 0.1:  # Less than 0.1N
+        return STATUS_ZERO
+    if force > 0:
+        if force < 1.0:
+            return STATUS_LIGHT
+        if force < 10.0:
+            return STATUS_MEDIUM
+        return STATUS_STRONG
+    return STATUS_NEGATIVE
+
+def drain_lines(ser, buf):
+    """Yield every complete line waiting on the serial port, blocking up to
+    the port timeout for the first byte"""
+    buf += ser.read(ser.in_waiting or 1)
+    end = buf.rfind(b'\n')
+    if end >= 0:
+        # One slice and split per wake; the partial tail stays in buf
+        lines = buf[:end].split(b'\n')
+        del buf[:end + 1]
+        yield from lines
+
+def serial_reader(ser, lines, rx=None):
+    """Background thread: push every line (data and command responses)
+    onto the queue until the port is closed, starting from any partial
+    line already read into rx"""
+    if rx is None:
+        rx = bytearray()
+    try:
+        while True:
+            for line in drain_lines(ser, rx):
+                lines.put(line)
+    except (serial.SerialException, TypeError, OSError):
+        pass
+
+def drain_queue(lines, timeout):
+    """Yield every line queued by the reader thread, waiting up to timeout
+    for the first one"""
+    try:
+        yield lines.get(timeout=timeout)
+        while True:
+            yield lines.get_nowait()
+    except queue.Empty:
+        return
+
+class RollingMedian:
+    """Median of a sliding window kept in two heaps with lazy deletion"""
+    
+    def __init__(self, window):
+        self.window = deque(maxlen=window)
+        self.low = []   # Max-heap (negated) of the lower half
+        self.high = []  # Min-heap of the upper half
+        self.low_size = 0
+        self.high_size = 0
+        self.delayed = {}  # Evicted values still sitting in a heap
+        
+    def __len__(self):
+        return len(self.window)
+    
+    def add(self, value):
+        """Push a new value, evicting the oldest once the window is full"""
+        if len(self.window) == self.window.maxlen:
+            self._discard(self.window[0])
+        self.window.append(value)
+        
+        if not self.low_size or value <= -self.low[0]:
+            heapq.heappush(self.low, -value)
+            self.low_size += 1
+        else:
+            heapq.heappush(self.high, value)
+            self.high_size += 1
+        self._rebalance()
+        
+        # Evicted values can sink below the heap tops and never get pruned
+        # (e.g. on a steady drift), so rebuild once they pile up
+        if len(self.low) + len(self.high) > 4 * self.window.maxlen:
+            self._rebuild()
+    
+    def median(self):
+        if self.low_size > self.high_size:
+            return -self.low[0]
+        return (-self.low[0] + self.high[0]) / 2
+    
+    def _discard(self, value):
+        self.delayed[value] = self.delayed.get(value, 0) + 1
+        if value <= -self.low[0]:
+            self.low_size -= 1
+            if value == -self.low[0]:
+                self._prune(self.low, -1)
+        else:
+            self.high_size -= 1
+            if value == self.high[0]:
+                self._prune(self.high, 1)
+        self._rebalance()
+    
+    def _prune(self, heap, sign):
+        # Drop evicted values from the top of a heap
+        while heap:
+            value = sign * heap[0]
+            count = self.delayed.get(value)
+            if not count:
+                break
+            if count == 1:
+                del self.delayed[value]
+            else:
+                self.delayed[value] = count - 1
+            heapq.heappop(heap)
+    
+    def _rebuild(self):
+        ordered = sorted(self.window)
+        half = (len(ordered) + 1) // 2
+        self.low = [-value for value in ordered[:half]]
+        heapq.heapify(self.low)
+        self.high = ordered[half:]
+        self.low_size = len(self.low)
+        self.high_size = len(self.high)
+        self.delayed.clear()
+    
+    def _rebalance(self):
+        if self.low_size > self.high_size + 1:
+            heapq.heappush(self.high, -heapq.heappop(self.low))
+            self.low_size -= 1
+            self.high_size += 1
+            self._prune(self.low, -1)
+        elif self.low_size < self.high_size:
+            heapq.heappush(self.low, -heapq.heappop(self.high))
+            self.high_size -= 1
+            self.low_size += 1
+            self._prune(self.high, 1)
+
 class KawaiiFC2231Monitor:
     def __init__(self):
         # Load calibration from persistent storage
@@ -34,9 +186,14 @@ class KawaiiFC2231Monitor:
         self.calibration_data = self.cal_manager.load_calibration()
         
         # Data buffers
-        self.voltage_buffer = deque(maxlen=10)  # Rolling average
-        self.force_buffer = deque(maxlen=10)
-        self.session_forces = []
+        self.voltage_buffer = RollingMedian(10)  # Rolling median
+        self.force_buffer = RollingMedian(10)
+        # Running stats of non-zero session forces (Welford)
+        self.force_count = 0
+        self.force_mean = 0.0
+        self.force_m2 = 0.0
+        self.force_min = math.inf
+        self.force_max = -math.inf
         self.session_start_time = datetime.now()
         
         # Statistics
@@ -47,88 +204,100 @@ class KawaiiFC2231Monitor:
         
         # Display timing
         self.last_display_time = 0
+        # Date/time text for the current second, shared by export and display
+        self._stamp_second = None
+        self._stamp_prefix = ''
         
-        # CSV export data
-        self.export_data = []
-        self.export_enabled = False
+        # CSV export, streamed to disk while recording ('e' toggles)
+        self.export_file = None
+        self.export_writer = None
+        self.export_filename = None
+        self.export_count = 0
+        
+        # Bound once; process_arduino_data runs for every sample
+        self._voltage_to_force = self.cal_manager.voltage_to_force
+        self._add_voltage = self.voltage_buffer.add
+        self._add_force = self.force_buffer.add
+        self._voltage_median = self.voltage_buffer.median
+        self._force_median = self.force_buffer.median
         
     def process_arduino_data(self, line):
-        """Process data line from Arduino"""
+        """Process a raw (bytes) data line from Arduino; returns True if it
+        was a reading"""
         try:
-            # Expected format: reading,voltage,V,temp,force_N,N,force_g,g,timestamp
-            parts = line.strip().split(',')
-            if len(parts) >= 9:
-                reading_num = parts[0]
-                voltage = float(parts[1])
-                temp = float(parts[3])
-                timestamp = parts[8]
+            m = LINE_RE.match(line)
+            if m:
+                reading_num = int(m[1])
+                voltage = float(m[2])
+                temp = float(m[3])
                 
                 # Apply our calibration
-                force_newtons = self.cal_manager.voltage_to_force(voltage, self.calibration_data)
-                force_grams = self.cal_manager.force_to_grams(force_newtons)
+                force_newtons = self._voltage_to_force(voltage, self.calibration_data)
                 
                 # Add to buffers
-                self.voltage_buffer.append(voltage)
-                self.force_buffer.append(force_newtons)
+                self._add_voltage(voltage)
+                self._add_force(force_newtons)
                 
                 # Calculate smoothed values
                 if len(self.voltage_buffer) >= 3:
-                    smoothed_voltage = statistics.median(self.voltage_buffer)
-                    smoothed_force = statistics.median(self.force_buffer)
+                    smoothed_voltage = self._voltage_median()
+                    smoothed_force = self._force_median()
                 else:
                     smoothed_voltage = voltage
                     smoothed_force = force_newtons
                 
                 # Update session data
-                self.session_forces.append(smoothed_force)
+                if abs(smoothed_force) > 0.05:  # >0.05N threshold
+                    self.force_count += 1
+                    delta = smoothed_force - self.force_mean
+                    self.force_mean += delta / self.force_count
+                    self.force_m2 += delta * (smoothed_force - self.force_mean)
+                    if smoothed_force < self.force_min:
+                        self.force_min = smoothed_force
+                    if smoothed_force > self.force_max:
+                        self.force_max = smoothed_force
                 self.last_voltage = smoothed_voltage
                 self.last_force_n = smoothed_force
-                self.last_force_g = self.cal_manager.force_to_grams(smoothed_force)
-                
-                # Determine status with kawaii styling
-                if abs(smoothed_force) < 0.1:  # Less than 0.1N
-                    status = "🌸 ZERO"
-                    force_display = "  0.00"
-                elif smoothed_force > 0:
-                    if smoothed_force < 1.0:
-                        status = "⚖️  LIGHT"
-                    elif smoothed_force < 10.0:
-                        status = "💪 MEDIUM"
-                    else:
-                        status = "🔥 STRONG"
-                    force_display = f"{smoothed_force:6.2f}"
-                else:
-                    status = "🔻 NEGATIVE"
-                    force_display = f"{smoothed_force:6.2f}"
+                self.last_force_g = smoothed_force * N_TO_GRAMS_FORCE
                 
                 self.reading_count += 1
-                current_time = datetime.now().strftime('%H:%M:%S')
-                current_datetime = datetime.now()
                 
-                # Store data for CSV export if enabled
-                if self.export_enabled:
-                    self.export_data.append({
-                        'Reading#': reading_num,
-                        'DateTime': current_datetime,
-                        'Time': current_time,
-                        'Voltage(V)': smoothed_voltage,
-                        'Force(N)': smoothed_force,
-                        'Force(g)': self.last_force_g,
-                        'Temperature(°C)': temp,
-                        'Status': status.replace('🌸 ', '').replace('⚖️  ', '').replace('💪 ', '').replace('🔥 ', '').replace('🔻 ', '')
-                    })
+                # Status and time text are only needed for an export row or
+                # the display line (every 5 seconds)
+                now = time.time()
+                display_due = now - self.last_display_time >= 5.0
+                if display_due or self.export_writer is not None:
+                    status = force_status(smoothed_force)
+                    second = int(now)
+                    if second != self._stamp_second:
+                        self._stamp_second = second
+                        self._stamp_prefix = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second))
+                
+                # Write data for CSV export if recording
+                if self.export_writer is not None:
+                    # Row in EXPORT_COLUMNS order, datetime with milliseconds
+                    self.export_writer(EXPORT_ROW % (
+                        reading_num,
+                        self._stamp_prefix, int((now - second) * 1000),
+                        self._stamp_prefix[11:],
+                        smoothed_voltage,
+                        smoothed_force,
+                        self.last_force_g,
+                        temp,
+                        status[1]
+                    ))
+                    self.export_count += 1
                 
-                # Only display every 5 seconds
-                current_timestamp = time.time()
-                if current_timestamp - self.last_display_time >= 5.0:
+                if display_due:
                     # Display with kawaii aesthetics
-                    print(f"{reading_num:>7} | {smoothed_voltage:>6.3f}V | {status:<10} | {force_display}N | {self.last_force_g:>7.1f}g | {temp:>5.1f}° | {current_time}")
-                    self.last_display_time = current_timestamp
+                    force_display = "  0.00" if status is STATUS_ZERO else f"{smoothed_force:6.2f}"
+                    print(f"{reading_num:>7} | {smoothed_voltage:>6.3f}V | {status[0]:<10} | {force_display}N | {self.last_force_g:>7.1f}g | {temp:>5.1f}° | {self._stamp_prefix[11:]}")
+                    self.last_display_time = now
                 
                 return True
                 
-        except (ValueError, IndexError) as e:
-            # Ignore invalid lines
+        except ValueError:
+            # Ignore invalid lines (e.g. an empty temperature field)
             pass
         
         return False
@@ -138,7 +307,7 @@ class KawaiiFC2231Monitor:
         ser.write(f"{command}\n".encode())
         time.sleep(0.1)
     
-    def perform_tare_calibration(self, ser):
+    def perform_tare_calibration(self, ser, lines):
         """Perform tare calibration using Arduino"""
         print(f"\n🌸 Kawaii Tare Calibration 🌸")
         print("Make sure no force is applied to the sensor!")
@@ -161,8 +330,7 @@ class KawaiiFC2231Monitor:
         
         while not calibration_complete and (time.time() - start_time) < 30:  # 30 second timeout
             try:
-                line = ser.readline()
-                if line:
+                for line in drain_queue(lines, 0.05):
                     decoded = line.decode('utf-8', errors='ignore').strip()
                     if decoded.startswith("FC2231,TARE,"):
                         parts = decoded.split(',')
@@ -210,45 +378,39 @@ class KawaiiFC2231Monitor:
         
         return True
 
-    def export_to_csv(self):
-        """Export collected data to CSV file"""
-        if not self.export_data:
-            print("📊 No data to export!")
-            return False
-            
+    def start_export(self):
+        """Open a new CSV file; rows are streamed to it as readings arrive"""
         try:
             # Create filename with timestamp
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"FC2231_Force_Data_{timestamp}.csv"
+            self.export_filename = f"FC2231_Force_Data_{timestamp}.csv"
+            self.export_file = open(self.export_filename, 'w', newline='', encoding='utf-8', buffering=1 << 20)
+            self.export_writer = self.export_file.write
+            self.export_count = 0
             
-            # Write CSV file
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                # Define CSV columns
-                fieldnames = [
-                    'Reading#', 'DateTime', 'Time', 'Voltage(V)', 
-                    'Force(N)', 'Force(g)', 'Temperature(°C)', 'Status'
-                ]
-                
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                # Write header
-                writer.writeheader()
-                
-                # Write data rows
-                for row in self.export_data:
-                    # Format datetime for CSV
-                    row_copy = row.copy()
-                    row_copy['DateTime'] = row['DateTime'].strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]  # Include milliseconds
-                    writer.writerow(row_copy)
+            # Write header
+            self.export_writer(",".join(EXPORT_COLUMNS) + "\r\n")
+            return True
             
-            print(f"✅ Data exported to: {filename}")
-            print(f"📊 Total records: {len(self.export_data)}")
+        except Exception as e:
+            print(f"❌ Export failed: {e}")
+            self.export_file = self.export_writer = None
+            return False
+    
+    def stop_export(self):
+        """Close the CSV file being recorded"""
+        try:
+            self.export_file.close()
+            print(f"✅ Data exported to: {self.export_filename}")
+            print(f"📊 Total records: {self.export_count}")
             print(f"📁 File opens in Excel, Google Sheets, or any text editor")
             return True
             
         except Exception as e:
             print(f"❌ Export failed: {e}")
             return False
+        finally:
+            self.export_file = self.export_writer = None
 
 def show_header():
     """Display beautiful header with kawaii aesthetics"""
@@ -282,15 +444,14 @@ def show_calibration_info(monitor):
 
 def show_statistics(monitor):
     """Display session statistics with kawaii styling"""
-    if monitor.session_forces:
-        non_zero_forces = [f for f in monitor.session_forces if abs(f) > 0.05]  # >0.05N threshold
-        if non_zero_forces:
+    if monitor.reading_count:
+        if monitor.force_count:
             print(f"\n📊 Session Statistics ~ UwU:")
-            print(f"   📉 Minimum: {min(non_zero_forces):>8.2f}N ({monitor.cal_manager.force_to_grams(min(non_zero_forces)):>6.0f}g)")
-            print(f"   📈 Maximum: {max(non_zero_forces):>8.2f}N ({monitor.cal_manager.force_to_grams(max(non_zero_forces)):>6.0f}g)")
-            print(f"   📊 Average: {statistics.mean(non_zero_forces):>8.2f}N ({monitor.cal_manager.force_to_grams(statistics.mean(non_zero_forces)):>6.0f}g)")
-            if len(non_zero_forces) > 1:
-                std_dev = statistics.stdev(non_zero_forces)
+            print(f"   📉 Minimum: {monitor.force_min:>8.2f}N ({monitor.cal_manager.force_to_grams(monitor.force_min):>6.0f}g)")
+            print(f"   📈 Maximum: {monitor.force_max:>8.2f}N ({monitor.cal_manager.force_to_grams(monitor.force_max):>6.0f}g)")
+            print(f"   📊 Average: {monitor.force_mean:>8.2f}N ({monitor.cal_manager.force_to_grams(monitor.force_mean):>6.0f}g)")
+            if monitor.force_count > 1:
+                std_dev = math.sqrt(monitor.force_m2 / (monitor.force_count - 1))
                 print(f"   📏 Std Dev: {std_dev:>8.2f}N ({monitor.cal_manager.force_to_grams(std_dev):>6.0f}g)")
             print(f"   🔢 Readings: {monitor.reading_count:>8}")
             
@@ -317,22 +478,34 @@ def fc2231_monitor():
     calibration_request = False
     
     try:
-        with serial.Serial(PORT, BAUDRATE, timeout=2) as ser:
+        with serial.Serial(PORT, BAUDRATE, timeout=0.05) as ser:
             # Wait for Arduino startup
             print("🤖 Waiting for Arduino startup...")
             time.sleep(3)
             
-            # Clear any startup messages
-            for _ in range(20):
-                try:
-                    line = ser.readline()
-                    if line:
-                        decoded = line.decode('utf-8', errors='ignore').strip()
-                        if decoded.startswith("FC2231,READY"):
-                            print("✅ Arduino FC2231 ready!")
-                            break
-                except:
-                    pass
+            # Clear any startup messages, matching only complete lines; the
+            # short port timeout just sets how often the deadline is checked.
+            # A data line also ends the wait, as READY may have been missed
+            # (e.g. a board that doesn't reset when the port opens)
+            lines = queue.SimpleQueue()
+            rx = bytearray()
+            ready = False
+            deadline = time.monotonic() + 10.0
+            while not ready and time.monotonic() < deadline:
+                for line in drain_lines(ser, rx):
+                    if ready:
+                        lines.put(line)  # Arrived in the same read, keep for the main loop
+                    elif line.startswith(b"FC2231,READY"):
+                        print("✅ Arduino FC2231 ready!")
+                        ready = True
+                    elif LINE_RE.match(line):
+                        print("✅ Arduino FC2231 already sending data!")
+                        lines.put(line)
+                        ready = True
+            
+            # Read on a background thread so bursts are queued at the port's
+            # pace, carrying on from whatever startup left in rx
+            threading.Thread(target=serial_reader, args=(ser, lines, rx), daemon=True).start()
             
             while True:
                 # Check for user input (Windows compatible)
@@ -341,12 +514,12 @@ def fc2231_monitor():
                     if key == 'c':
                         calibration_request = True
                     elif key == 'e':
-                        monitor.export_enabled = not monitor.export_enabled
-                        if monitor.export_enabled:
-                            print(f"\n📊 CSV export ENABLED - Recording data for export...")
-                            monitor.export_data = []  # Clear previous data
+                        if monitor.export_file is None:
+                            if monitor.start_export():
+                                print(f"\n📊 CSV export ENABLED - Recording to {monitor.export_filename}...")
                         else:
                             print(f"\n📊 CSV export DISABLED")
+                            monitor.stop_export()
                         print("-" * 80)
                     elif key == 'q':
                         print(f"\n👋 Quit requested by user")
@@ -355,7 +528,7 @@ def fc2231_monitor():
                 # Handle calibration request
                 if calibration_request:
                     print(f"\n🌸 Calibration requested! 🌸")
-                    if monitor.perform_tare_calibration(ser):
+                    if monitor.perform_tare_calibration(ser, lines):
                         print("✅ Calibration complete! Resuming monitoring...")
                         show_calibration_info(monitor)
                         print("-" * 80)
@@ -366,39 +539,25 @@ def fc2231_monitor():
                         print("-" * 80)
                     calibration_request = False
                 
-                # Read data from Arduino
-                try:
-                    line = ser.readline()
-                    if line:
-                        decoded = line.decode('utf-8', errors='ignore').strip()
-                        
-                        # Process data lines (skip command responses)
-                        if not decoded.startswith("FC2231,") and ',' in decoded:
-                            monitor.process_arduino_data(decoded)
-                            
-                            # Periodic statistics display
-                            if monitor.reading_count % 100 == 0:
-                                show_statistics(monitor)
-                                print("-" * 80)
-                        
-                except serial.SerialTimeoutException:
-                    pass
-                except Exception as e:
-                    print(f"⚠️  Serial error: {e}")
-                    time.sleep(1)
-                
-                time.sleep(0.01)  # Small delay to prevent CPU overload
+                # Process everything the reader queued; waits up to 50 ms
+                # when idle, so there is no separate sleep
+                for line in drain_queue(lines, 0.05):
+                    # Data lines are parsed straight from the bytes; command
+                    # responses don't match and are skipped
+                    if monitor.process_arduino_data(line):
+                        # Periodic statistics display
+                        if monitor.reading_count % 100 == 0:
+                            show_statistics(monitor)
+                            print("-" * 80)
                 
     except KeyboardInterrupt:
         print(f"\n\n🌸 Kawaii FC2231 Session Complete! >w< 🌸")
         show_statistics(monitor)
         
-        # Offer CSV export if data was recorded
-        if monitor.export_data:
-            print(f"\n📊 {len(monitor.export_data)} data points recorded for export")
-            response = input("Export to CSV? (y/N): ").lower()
-            if response in ['y', 'yes']:
-                monitor.export_to_csv()
+        # Finish the CSV file if still recording
+        if monitor.export_file is not None:
+            print()
+            monitor.stop_export()
         
         print(f"\n🙏 Thank you for using FC2231 Force Monitor! UwU 🙏")
         print("=" * 80)
@@ -408,6 +567,10 @@ def fc2231_monitor():
         print(f"💡 Check if the correct COM port is being used")
     except Exception as e:
         print(f"\n❌ Unexpected error: {e}")
+    finally:
+        # Don't lose buffered rows on 'q' or an error
+        if monitor.export_file is not None:
+            monitor.stop_export()
 
 if __name__ == "__main__":
     fc2231_monitor()
\ No newline at end of file